@@ -0,0 +1,33 @@
+"""Keyset pagination cursors.
+
+A cursor is the sort key of the last row on a page, joined with "|" and
+base64-encoded so clients treat it as opaque.
+"""
+
+import base64
+import binascii
+from typing import Any, List
+
+
+def encode_cursor(*parts: Any) -> str:
+    """Encode sort key values (datetimes/dates as ISO strings) into a cursor."""
+    raw = "|".join(p.isoformat() if hasattr(p, "isoformat") else str(p) for p in parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, parts: int) -> List[str]:
+    """
+    Decode a cursor into its string parts.
+
+    Raises:
+        ValueError: If the cursor is malformed or has the wrong arity
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    values = raw.split("|")
+    if len(values) != parts:
+        raise ValueError("Invalid cursor")
+    return values
@@ -13,6 +13,7 @@ import structlog
 
 from app.db.session import get_db
 from app.models.transaction import Transaction
+from app.models.enums import TxnSource, TxnStatus
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -21,9 +22,9 @@ logger = structlog.get_logger()
 @router.get("/transactions")
 async def export_transactions(
     format: str = Query("csv", description="csv | xlsx"),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
+    status: Optional[TxnStatus] = Query(None),
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
     db: AsyncSession = Depends(get_db),
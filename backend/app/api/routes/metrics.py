@@ -5,14 +5,14 @@ from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func, and_, case, literal
+from sqlalchemy import select, func, and_, case, literal, cast, BigInteger
 from sqlalchemy.ext.asyncio import AsyncSession
-import orjson
 
 from app.db.session import get_db
 from app.db.redis import cache
 from app.config import settings
 from app.models.transaction import Transaction
+from app.models.enums import TxnSource
 from app.schemas.metrics import (
     MetricsOverview,
     StatusMetrics,
@@ -43,15 +43,28 @@ from app.schemas.metrics import (
     HorizontalBarItem,
     HorizontalBarResponse,
 )
+from app.schemas._adapters import METRICS_OVERVIEW_ADAPTER, json_response
 
 router = APIRouter()
 
 
+# Amount aggregates are returned as fixed-point integers (units of 1/10_000),
+# summed from the generated amount_micros / amount_usd_micros bigint columns.
+def _sum_micros(column):
+    """SUM of a bigint *_micros column, without numeric arithmetic."""
+    return cast(func.coalesce(func.sum(column), 0), BigInteger)
+
+
+def _from_micros(value: Optional[int]) -> Decimal:
+    """Convert a fixed-point aggregate to Decimal at the schema boundary."""
+    return Decimal(value or 0).scaleb(-4)
+
+
 @router.get("/overview", response_model=MetricsOverview)
 async def get_metrics_overview(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -69,7 +82,8 @@ async def get_metrics_overview(
     cache_key = f"metrics:overview:{from_date}:{to_date}:{source}:{project}"
     cached = await cache.get(cache_key)
     if cached:
-        return MetricsOverview.model_validate(orjson.loads(cached))
+        # Cached payload is already the serialized response
+        return json_response(cached)
 
     # Build query conditions
     conditions = [
@@ -84,42 +98,42 @@ async def get_metrics_overview(
     # Query aggregates (including USD amounts)
     query = select(
         func.count(Transaction.id).label("total_count"),
-        func.coalesce(func.sum(Transaction.amount), 0).label("total_amount"),
-        func.coalesce(func.sum(Transaction.amount_usd), 0).label("total_amount_usd"),
+        _sum_micros(Transaction.amount_micros).label("total_amount"),
+        _sum_micros(Transaction.amount_usd_micros).label("total_amount_usd"),
         func.count(case((Transaction.status == "success", 1))).label("success_count"),
-        func.coalesce(
-            func.sum(case((Transaction.status == "success", Transaction.amount))), 0
+        _sum_micros(
+            case((Transaction.status == "success", Transaction.amount_micros))
         ).label("success_amount"),
-        func.coalesce(
-            func.sum(case((Transaction.status == "success", Transaction.amount_usd))), 0
+        _sum_micros(
+            case((Transaction.status == "success", Transaction.amount_usd_micros))
         ).label("success_amount_usd"),
         func.count(case((Transaction.status == "failed", 1))).label("failed_count"),
-        func.coalesce(
-            func.sum(case((Transaction.status == "failed", Transaction.amount))), 0
+        _sum_micros(
+            case((Transaction.status == "failed", Transaction.amount_micros))
         ).label("failed_amount"),
-        func.coalesce(
-            func.sum(case((Transaction.status == "failed", Transaction.amount_usd))), 0
+        _sum_micros(
+            case((Transaction.status == "failed", Transaction.amount_usd_micros))
         ).label("failed_amount_usd"),
         func.count(case((Transaction.status == "pending", 1))).label("pending_count"),
-        func.coalesce(
-            func.sum(case((Transaction.status == "pending", Transaction.amount))), 0
+        _sum_micros(
+            case((Transaction.status == "pending", Transaction.amount_micros))
         ).label("pending_amount"),
-        func.coalesce(
-            func.sum(case((Transaction.status == "pending", Transaction.amount_usd))), 0
+        _sum_micros(
+            case((Transaction.status == "pending", Transaction.amount_usd_micros))
         ).label("pending_amount_usd"),
         func.count(case((Transaction.source == "vima", 1))).label("vima_count"),
-        func.coalesce(
-            func.sum(case((Transaction.source == "vima", Transaction.amount))), 0
+        _sum_micros(
+            case((Transaction.source == "vima", Transaction.amount_micros))
         ).label("vima_amount"),
-        func.coalesce(
-            func.sum(case((Transaction.source == "vima", Transaction.amount_usd))), 0
+        _sum_micros(
+            case((Transaction.source == "vima", Transaction.amount_usd_micros))
         ).label("vima_amount_usd"),
         func.count(case((Transaction.source == "payshack", 1))).label("payshack_count"),
-        func.coalesce(
-            func.sum(case((Transaction.source == "payshack", Transaction.amount))), 0
+        _sum_micros(
+            case((Transaction.source == "payshack", Transaction.amount_micros))
         ).label("payshack_amount"),
-        func.coalesce(
-            func.sum(case((Transaction.source == "payshack", Transaction.amount_usd))), 0
+        _sum_micros(
+            case((Transaction.source == "payshack", Transaction.amount_usd_micros))
         ).label("payshack_amount_usd"),
     ).where(and_(*conditions))
 
@@ -127,8 +141,8 @@ async def get_metrics_overview(
     row = result.one()
 
     total_count = row.total_count or 0
-    total_amount = Decimal(str(row.total_amount or 0))
-    total_amount_usd = Decimal(str(row.total_amount_usd or 0))
+    total_amount = _from_micros(row.total_amount)
+    total_amount_usd = _from_micros(row.total_amount_usd)
     success_count = row.success_count or 0
 
     conversion_rate = (success_count / total_count * 100) if total_count > 0 else 0
@@ -145,30 +159,30 @@ async def get_metrics_overview(
         by_status={
             "success": StatusMetrics(
                 count=row.success_count or 0,
-                amount=Decimal(str(row.success_amount or 0)),
-                amount_usd=Decimal(str(row.success_amount_usd or 0)),
+                amount=_from_micros(row.success_amount),
+                amount_usd=_from_micros(row.success_amount_usd),
             ),
             "failed": StatusMetrics(
                 count=row.failed_count or 0,
-                amount=Decimal(str(row.failed_amount or 0)),
-                amount_usd=Decimal(str(row.failed_amount_usd or 0)),
+                amount=_from_micros(row.failed_amount),
+                amount_usd=_from_micros(row.failed_amount_usd),
             ),
             "pending": StatusMetrics(
                 count=row.pending_count or 0,
-                amount=Decimal(str(row.pending_amount or 0)),
-                amount_usd=Decimal(str(row.pending_amount_usd or 0)),
+                amount=_from_micros(row.pending_amount),
+                amount_usd=_from_micros(row.pending_amount_usd),
             ),
         },
         by_source={
             "vima": StatusMetrics(
                 count=row.vima_count or 0,
-                amount=Decimal(str(row.vima_amount or 0)),
-                amount_usd=Decimal(str(row.vima_amount_usd or 0)),
+                amount=_from_micros(row.vima_amount),
+                amount_usd=_from_micros(row.vima_amount_usd),
             ),
             "payshack": StatusMetrics(
                 count=row.payshack_count or 0,
-                amount=Decimal(str(row.payshack_amount or 0)),
-                amount_usd=Decimal(str(row.payshack_amount_usd or 0)),
+                amount=_from_micros(row.payshack_amount),
+                amount_usd=_from_micros(row.payshack_amount_usd),
             ),
         },
         conversion_rate=round(conversion_rate, 2),
@@ -177,20 +191,17 @@ async def get_metrics_overview(
     )
 
     # Cache result
-    await cache.set(
-        cache_key,
-        orjson.dumps(metrics.model_dump(mode="json")).decode(),
-        ttl=settings.cache_ttl_metrics,
-    )
+    payload = METRICS_OVERVIEW_ADAPTER.dump_json(metrics)
+    await cache.set(cache_key, payload.decode(), ttl=settings.cache_ttl_metrics)
 
-    return metrics
+    return json_response(payload)
 
 
 @router.get("/by-project", response_model=MetricsByProject)
 async def get_metrics_by_project(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
     """Get metrics grouped by project."""
@@ -206,23 +217,24 @@ async def get_metrics_by_project(
     if source:
         conditions.append(Transaction.source == source)
 
+    total_amount = _sum_micros(Transaction.amount_micros).label("total_amount")
     query = (
         select(
             Transaction.project,
             func.count(Transaction.id).label("total_count"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("total_amount"),
+            total_amount,
             func.count(case((Transaction.status == "success", 1))).label("success_count"),
-            func.coalesce(
-                func.sum(case((Transaction.status == "success", Transaction.amount))), 0
+            _sum_micros(
+                case((Transaction.status == "success", Transaction.amount_micros))
             ).label("success_amount"),
             func.count(case((Transaction.status == "failed", 1))).label("failed_count"),
-            func.coalesce(
-                func.sum(case((Transaction.status == "failed", Transaction.amount))), 0
+            _sum_micros(
+                case((Transaction.status == "failed", Transaction.amount_micros))
             ).label("failed_amount"),
         )
         .where(and_(*conditions))
         .group_by(Transaction.project)
-        .order_by(func.sum(Transaction.amount).desc())
+        .order_by(total_amount.desc())
     )
 
     result = await db.execute(query)
@@ -236,11 +248,11 @@ async def get_metrics_by_project(
             ProjectMetrics(
                 project=row.project or "unknown",
                 total_count=total,
-                total_amount=Decimal(str(row.total_amount or 0)),
+                total_amount=_from_micros(row.total_amount),
                 success_count=success,
-                success_amount=Decimal(str(row.success_amount or 0)),
+                success_amount=_from_micros(row.success_amount),
                 failed_count=row.failed_count or 0,
-                failed_amount=Decimal(str(row.failed_amount or 0)),
+                failed_amount=_from_micros(row.failed_amount),
                 conversion_rate=round((success / total * 100) if total > 0 else 0, 2),
             )
         )
@@ -256,7 +268,7 @@ async def get_metrics_trends(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
     granularity: str = Query("hour", description="minute | 5min | 15min | hour | day"),
-    source: Optional[str] = Query(None, description="Filter by source: vima | payshack"),
+    source: Optional[TxnSource] = Query(None, description="Filter by source: vima | payshack"),
     project: Optional[str] = Query(None, description="Filter by project"),
     db: AsyncSession = Depends(get_db),
 ):
@@ -305,7 +317,8 @@ async def get_metrics_trends(
         select(
             time_group.label("timestamp"),
             func.count(Transaction.id).label("count"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("amount"),
+            _sum_micros(Transaction.amount_micros).label("amount"),
+            _sum_micros(Transaction.amount_usd_micros).label("amount_usd"),
             func.count(case((Transaction.status == "success", 1))).label("success_count"),
             func.count(case((Transaction.status == "failed", 1))).label("failed_count"),
             func.count(case((Transaction.status == "pending", 1))).label("pending_count"),
@@ -327,7 +340,8 @@ async def get_metrics_trends(
             TrendPoint(
                 timestamp=row.timestamp,
                 count=total,
-                amount=Decimal(str(row.amount or 0)),
+                amount=_from_micros(row.amount),
+                amount_usd=_from_micros(row.amount_usd),
                 success_count=success,
                 failed_count=row.failed_count or 0,
                 pending_count=row.pending_count or 0,
@@ -349,7 +363,7 @@ DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 async def get_hourly_distribution(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -428,7 +442,7 @@ AMOUNT_BUCKETS = [
 async def get_amount_distribution(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -466,7 +480,7 @@ async def get_amount_distribution(
             bucket_case.label("bucket_index"),
             hour.label("hour"),
             func.count(Transaction.id).label("count"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("total_amount"),
+            _sum_micros(Transaction.amount_micros).label("total_amount"),
         )
         .where(and_(*conditions))
         .group_by(bucket_case, hour)
@@ -486,7 +500,7 @@ async def get_amount_distribution(
                 bucket_index=bucket_idx,
                 hour=int(row.hour),
                 count=row.count or 0,
-                total_amount=Decimal(str(row.total_amount or 0)),
+                total_amount=_from_micros(row.total_amount),
             )
         )
 
@@ -501,7 +515,7 @@ async def get_amount_distribution(
 async def get_conversion_by_project(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -616,7 +630,8 @@ async def get_metrics_by_source(
             select(
                 time_group.label("timestamp"),
                 func.count(Transaction.id).label("count"),
-                func.coalesce(func.sum(Transaction.amount), 0).label("amount"),
+                _sum_micros(Transaction.amount_micros).label("amount"),
+                _sum_micros(Transaction.amount_usd_micros).label("amount_usd"),
                 func.count(case((Transaction.status == "success", 1))).label("success_count"),
                 func.count(case((Transaction.status == "failed", 1))).label("failed_count"),
                 func.count(case((Transaction.status == "pending", 1))).label("pending_count"),
@@ -631,20 +646,23 @@ async def get_metrics_by_source(
 
         data = []
         total_count = 0
-        total_amount = Decimal(0)
+        total_micros = 0
+        total_usd_micros = 0
 
         for row in rows:
             count = row.count or 0
             success = row.success_count or 0
             conversion = round((success / count * 100), 2) if count > 0 else 0.0
             total_count += count
-            total_amount += Decimal(str(row.amount or 0))
+            total_micros += row.amount
+            total_usd_micros += row.amount_usd
 
             data.append(
                 TrendPoint(
                     timestamp=row.timestamp,
                     count=count,
-                    amount=Decimal(str(row.amount or 0)),
+                    amount=_from_micros(row.amount),
+                    amount_usd=_from_micros(row.amount_usd),
                     success_count=success,
                     failed_count=row.failed_count or 0,
                     pending_count=row.pending_count or 0,
@@ -656,7 +674,11 @@ async def get_metrics_by_source(
             SourceTrendData(
                 source=source_name,
                 data=data,
-                totals=StatusMetrics(count=total_count, amount=total_amount),
+                totals=StatusMetrics(
+                    count=total_count,
+                    amount=_from_micros(total_micros),
+                    amount_usd=_from_micros(total_usd_micros),
+                ),
             )
         )
 
@@ -673,7 +695,7 @@ async def get_heatmap(
     metric: str = Query("amount", description="amount | count | conversion"),
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -727,7 +749,7 @@ async def get_heatmap(
                     hour.label("hour"),
                     day_of_week.label("dow"),
                     func.count(Transaction.id).label("count"),
-                    func.coalesce(func.sum(Transaction.amount), 0).label("amount"),
+                    _sum_micros(Transaction.amount_micros).label("amount"),
                 )
                 .where(and_(*conditions))
                 .group_by(hour, day_of_week)
@@ -740,7 +762,7 @@ async def get_heatmap(
             count = row.count or 0
 
             if metric == "amount":
-                value = Decimal(str(row.amount or 0))
+                value = _from_micros(row.amount)
             elif metric == "count":
                 value = Decimal(count)
             else:  # conversion
@@ -761,18 +783,19 @@ async def get_heatmap(
         x_labels = [str(i) for i in range(24)]
 
         hour = func.extract("hour", Transaction.created_at)
+        amount = _sum_micros(Transaction.amount_micros).label("amount")
 
         query = (
             select(
                 Transaction.project,
                 hour.label("hour"),
                 func.count(Transaction.id).label("count"),
-                func.coalesce(func.sum(Transaction.amount), 0).label("amount"),
+                amount,
                 func.count(case((Transaction.status == "success", 1))).label("success_count"),
             )
             .where(and_(*conditions))
             .group_by(Transaction.project, hour)
-            .order_by(func.sum(Transaction.amount).desc())
+            .order_by(amount.desc())
         )
 
         result = await db.execute(query)
@@ -791,7 +814,7 @@ async def get_heatmap(
             count = row.count or 0
 
             if metric == "amount":
-                value = Decimal(str(row.amount or 0))
+                value = _from_micros(row.amount)
             elif metric == "count":
                 value = Decimal(count)
             else:  # conversion
@@ -812,18 +835,19 @@ async def get_heatmap(
         x_labels = DAY_NAMES
 
         day_of_week = func.extract("isodow", Transaction.created_at) - 1
+        amount = _sum_micros(Transaction.amount_micros).label("amount")
 
         query = (
             select(
                 Transaction.project,
                 day_of_week.label("dow"),
                 func.count(Transaction.id).label("count"),
-                func.coalesce(func.sum(Transaction.amount), 0).label("amount"),
+                amount,
                 func.count(case((Transaction.status == "success", 1))).label("success_count"),
             )
             .where(and_(*conditions))
             .group_by(Transaction.project, day_of_week)
-            .order_by(func.sum(Transaction.amount).desc())
+            .order_by(amount.desc())
         )
 
         result = await db.execute(query)
@@ -842,7 +866,7 @@ async def get_heatmap(
             count = row.count or 0
 
             if metric == "amount":
-                value = Decimal(str(row.amount or 0))
+                value = _from_micros(row.amount)
             elif metric == "count":
                 value = Decimal(count)
             else:  # conversion
@@ -892,7 +916,7 @@ async def get_period_comparison(
     comparison_type: str = Query("day", description="day | week | month"),
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1027,7 +1051,7 @@ async def get_period_comparison(
 async def get_metrics_by_country(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
     """Get metrics grouped by country."""
@@ -1110,7 +1134,7 @@ async def get_metrics_by_country(
 async def get_metrics_by_merchant(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     search: Optional[str] = Query(None, description="Search by project name"),
     sort_by: str = Query("total_amount", description="total_amount | total_count | conversion_rate"),
     order: str = Query("desc", description="asc | desc"),
@@ -1220,7 +1244,7 @@ async def get_metrics_by_merchant(
 @router.get("/rpm", response_model=RPMResponse)
 async def get_rpm_metrics(
     minutes: int = Query(60, ge=5, le=1440, description="Number of minutes to analyze"),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1302,7 +1326,7 @@ async def get_rpm_metrics(
 
 @router.get("/live", response_model=LiveMetrics)
 async def get_live_metrics(
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     project: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1378,7 +1402,7 @@ async def get_horizontal_bar_data(
     metric_type: str,  # "volume-by-project" | "count-by-project" | "volume-by-status" | "conversion-by-project"
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    source: Optional[str] = Query(None),
+    source: Optional[TxnSource] = Query(None),
     limit: int = Query(10, ge=1, le=50),
     db: AsyncSession = Depends(get_db),
 ):
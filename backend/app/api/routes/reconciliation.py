@@ -1,20 +1,28 @@
 """Reconciliation endpoints."""
 
-from datetime import date
+from datetime import date, datetime
+from uuid import UUID
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, and_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.pagination import decode_cursor, encode_cursor
+from app.db.approx_count import estimate_or_count
 from app.db.session import get_db
 from app.models.reconciliation import ReconciliationRun, ReconciliationResult
+from app.models.enums import MatchStatus
 from app.schemas.reconciliation import (
     ReconciliationSummary,
-    DiscrepancyResponse,
     DiscrepancyListResponse,
     ReconciliationRunRequest,
 )
+from app.schemas._adapters import (
+    DISCREPANCY_LIST_ADAPTER,
+    DISCREPANCY_LIST_RESPONSE_ADAPTER,
+    json_response,
+)
 
 router = APIRouter()
 
@@ -75,14 +83,18 @@ async def get_reconciliation_summary(
 async def list_discrepancies(
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    match_status: Optional[str] = Query(None, description="discrepancy | missing_vima | missing_payshack"),
+    match_status: Optional[MatchStatus] = Query(None, description="discrepancy | missing_vima | missing_payshack"),
     discrepancy_type: Optional[str] = Query(None, description="amount | status | time"),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List reconciliation discrepancies with filters.
+
+    Pass the returned next_cursor to fetch the following page; page is
+    only used when no cursor is given.
     """
     conditions = []
     
@@ -98,34 +110,59 @@ async def list_discrepancies(
     if discrepancy_type:
         conditions.append(ReconciliationResult.discrepancy_type == discrepancy_type)
 
-    # Count query
-    count_query = select(func.count(ReconciliationResult.id))
+    query = select(ReconciliationResult)
     if conditions:
-        count_query = count_query.where(and_(*conditions))
-    
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        query = query.where(and_(*conditions))
+
+    # Count (planner estimate for large result sets)
+    total, is_approx = await estimate_or_count(db, query)
 
-    # Data query
-    query = select(ReconciliationResult).order_by(
+    # Data query (keyset on recon_date, created_at, id)
+    query = query.order_by(
         ReconciliationResult.recon_date.desc(),
         ReconciliationResult.created_at.desc(),
+        ReconciliationResult.id.desc(),
     )
-    if conditions:
-        query = query.where(and_(*conditions))
-    
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
+    if cursor:
+        try:
+            recon_date, created_at, result_id = decode_cursor(cursor, 3)
+            cursor_key = (
+                date.fromisoformat(recon_date),
+                datetime.fromisoformat(created_at),
+                UUID(result_id),
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(
+            tuple_(
+                ReconciliationResult.recon_date,
+                ReconciliationResult.created_at,
+                ReconciliationResult.id,
+            ) < cursor_key
+        )
+    else:
+        query = query.offset((page - 1) * limit)
+    # One extra row tells whether there is a next page
+    query = query.limit(limit + 1)
 
     result = await db.execute(query)
     items = result.scalars().all()
 
-    return DiscrepancyListResponse(
-        items=[DiscrepancyResponse.model_validate(item) for item in items],
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last.recon_date, last.created_at, last.id)
+
+    response = DiscrepancyListResponse(
+        items=DISCREPANCY_LIST_ADAPTER.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         limit=limit,
+        is_approx=is_approx,
+        next_cursor=next_cursor,
     )
+    return json_response(DISCREPANCY_LIST_RESPONSE_ADAPTER.dump_json(response))
 
 
 @router.post("/run")
@@ -51,6 +51,7 @@ async def get_sync_status(
                 status=state.sync_status,
                 last_sync_at=state.last_sync_at,
                 last_successful_sync=state.last_successful_sync,
+                last_heartbeat_at=state.last_heartbeat_at,
                 records_synced=state.records_synced or 0,
                 total_records=state.total_records or 0,
                 error_message=state.error_message,
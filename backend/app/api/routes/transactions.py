@@ -1,43 +1,59 @@
 """Transaction endpoints."""
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, and_, or_, desc, asc
+from sqlalchemy import select, and_, or_, desc, asc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.pagination import decode_cursor, encode_cursor
+from app.db.approx_count import estimate_or_count
+from app.db.jsonb import jsonb_field_equals, jsonb_field_not_equals
 from app.db.session import get_db
 from app.models.transaction import Transaction
+from app.models.enums import TxnSource, TxnStatus
 from app.schemas.transaction import (
     TransactionResponse,
     TransactionListResponse,
 )
+from app.schemas._adapters import (
+    TXN_LIST_ADAPTER,
+    TXN_LIST_RESPONSE_ADAPTER,
+    json_response,
+)
 
 router = APIRouter()
 
 
 @router.get("", response_model=TransactionListResponse)
 async def list_transactions(
-    source: Optional[str] = Query(None, description="Filter by source: vima | payshack"),
+    source: Optional[TxnSource] = Query(None, description="Filter by source: vima | payshack"),
     project: Optional[str] = Query(None, description="Filter by project"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status: Optional[TxnStatus] = Query(None, description="Filter by status"),
     from_date: Optional[date] = Query(None, description="Start date"),
     to_date: Optional[date] = Query(None, description="End date"),
     search: Optional[str] = Query(None, description="Search by ID, email, etc."),
+    raw_key: Optional[str] = Query(None, description="Raw payload field to filter on"),
+    raw_value: Optional[str] = Query(None, description="Raw payload field value"),
+    raw_op: str = Query("eq", description="Raw payload comparison: eq | ne"),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     sort_by: str = Query("created_at", description="Sort field"),
     order: str = Query("desc", description="Sort order: asc | desc"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List transactions with filters and pagination.
+
+    Sorting by created_at (the default) supports keyset pagination: pass
+    the returned next_cursor to get the following page. Without a cursor,
+    and for other sort fields, page/limit offsets apply.
     """
     # Build query
     query = select(Transaction)
-    count_query = select(func.count(Transaction.id))
 
     # Apply filters
     conditions = []
@@ -63,37 +79,66 @@ async def list_transactions(
                 Transaction.utr.ilike(search_pattern),
             )
         )
+    if raw_key and raw_value is not None:
+        if raw_op == "ne":
+            conditions.append(jsonb_field_not_equals(Transaction.raw_data, raw_key, raw_value))
+        else:
+            conditions.append(jsonb_field_equals(Transaction.raw_data, raw_key, raw_value))
 
     if conditions:
         query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Get total count (planner estimate for broad filters, exact for selective ones)
+    total, is_approx = await estimate_or_count(
+        db, query, exact=bool(search or (raw_key and raw_op == "eq"))
+    )
 
     # Apply sorting
-    sort_column = getattr(Transaction, sort_by, Transaction.created_at)
-    if order.lower() == "asc":
-        query = query.order_by(asc(sort_column))
-    else:
-        query = query.order_by(desc(sort_column))
+    ascending = order.lower() == "asc"
+    direction = asc if ascending else desc
+    keyset = sort_by == "created_at"
 
-    # Apply pagination
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
+    if keyset:
+        query = query.order_by(direction(Transaction.created_at), direction(Transaction.id))
+        if cursor:
+            try:
+                cursor_ts, cursor_id = decode_cursor(cursor, 2)
+                cursor_key = (datetime.fromisoformat(cursor_ts), UUID(cursor_id))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            key = tuple_(Transaction.created_at, Transaction.id)
+            query = query.where(key > cursor_key if ascending else key < cursor_key)
+        else:
+            query = query.offset((page - 1) * limit)
+        # One extra row tells whether there is a next page
+        query = query.limit(limit + 1)
+    else:
+        if cursor:
+            raise HTTPException(status_code=400, detail="Cursor requires sort_by=created_at")
+        sort_column = getattr(Transaction, sort_by, Transaction.created_at)
+        query = query.order_by(direction(sort_column))
+        query = query.offset((page - 1) * limit).limit(limit)
 
     # Execute
     result = await db.execute(query)
     transactions = result.scalars().all()
 
-    return TransactionListResponse(
-        items=[TransactionResponse.model_validate(t) for t in transactions],
+    next_cursor = None
+    if keyset and len(transactions) > limit:
+        transactions = transactions[:limit]
+        last = transactions[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    response = TransactionListResponse(
+        items=TXN_LIST_ADAPTER.validate_python(transactions, from_attributes=True),
         total=total,
         page=page,
         limit=limit,
         pages=(total + limit - 1) // limit if total > 0 else 0,
+        is_approx=is_approx,
+        next_cursor=next_cursor,
     )
+    return json_response(TXN_LIST_RESPONSE_ADAPTER.dump_json(response))
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
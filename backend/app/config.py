@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     # Sync settings
     sync_batch_size: int = 100
     sync_max_retries: int = 3
+    sync_analyze_min_records: int = 1000  # ANALYZE transactions after larger loads
 
     # Historical sync settings (first run)
     initial_sync_days: int = 7  # Days to load on first run
@@ -0,0 +1,60 @@
+"""Planner-based row count estimates for paginated listings."""
+
+import json
+from typing import Tuple
+
+from sqlalchemy import Select, bindparam, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Below this estimate an exact COUNT(*) is cheap enough to run
+APPROX_COUNT_THRESHOLD = 10_000
+
+
+async def approx_count(session: AsyncSession, stmt: Select) -> int:
+    """
+    Estimate the number of rows a SELECT would return.
+
+    Uses the planner's row estimate from EXPLAIN (no execution), which is
+    backed by pg_class.reltuples and column statistics.
+    """
+    # Keep filter values as bound parameters: inlined literals would be
+    # re-parsed by text(), turning e.g. ":word" in a value into a bind
+    compiled = stmt.compile(
+        dialect=postgresql.dialect(paramstyle="named"),
+        compile_kwargs={"render_postcompile": True},
+    )
+    types = {name: bind.type for bind, name in compiled.bind_names.items()}
+    explain = text(f"EXPLAIN (FORMAT JSON) {compiled}").bindparams(
+        *(
+            bindparam(name, value, type_=types.get(name))
+            for name, value in compiled.params.items()
+        )
+    )
+    result = await session.execute(explain)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def estimate_or_count(
+    session: AsyncSession,
+    stmt: Select,
+    exact: bool = False,
+) -> Tuple[int, bool]:
+    """
+    Get total rows for a listing query.
+
+    Returns (total, is_approx). The planner estimate is used for large
+    result sets; small ones, or callers passing exact=True for selective
+    filters, get an exact COUNT(*).
+    """
+    if not exact:
+        estimate = await approx_count(session, stmt)
+        if estimate > APPROX_COUNT_THRESHOLD:
+            return estimate, True
+
+    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+    result = await session.execute(count_stmt)
+    return result.scalar() or 0, False
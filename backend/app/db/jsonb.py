@@ -0,0 +1,33 @@
+"""JSONB filter helpers.
+
+Filters on raw payload fields are written as containment (@>) so they can
+use the GIN jsonb_path_ops indexes on raw_data columns. Expressions like
+raw_data->>'key' = :value cannot use those indexes.
+"""
+
+from typing import Any
+
+from sqlalchemy import Text, and_, cast, func, not_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def jsonb_field_equals(column: Any, key: str, value: Any) -> ColumnElement:
+    """column @> jsonb_build_object(key, value)"""
+    # jsonb_build_object takes VARIADIC "any", so text binds need explicit types
+    if isinstance(value, str):
+        value = cast(value, Text)
+    return column.op("@>")(func.jsonb_build_object(cast(key, Text), value))
+
+
+def jsonb_field_not_equals(column: Any, key: str, value: Any) -> ColumnElement:
+    """
+    column ? key AND NOT column @> jsonb_build_object(key, value)
+
+    Not index-assisted: jsonb_path_ops supports only @>, not ?, and a
+    negated containment cannot use a GIN index. Callers should pair it
+    with other selective filters (e.g. a created_at range).
+    """
+    return and_(
+        column.has_key(key),
+        not_(jsonb_field_equals(column, key, value)),
+    )
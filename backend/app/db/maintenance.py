@@ -0,0 +1,65 @@
+"""Post-load table maintenance."""
+
+from datetime import date
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.partitions import transaction_partition_name
+
+logger = structlog.get_logger()
+
+# Columns the dashboard filters and groups on
+ANALYZE_COLUMNS = ("source", "created_at", "status", "project", "country")
+
+BALANCE_HOURLY_VIEW = "payshack_balance_hourly"
+
+
+async def analyze_transactions(session: AsyncSession, records_synced: int) -> None:
+    """
+    Refresh planner statistics on the current month's transactions after a
+    bulk load.
+
+    Only the partition receiving today's rows is analyzed; ANALYZE on the
+    partitioned parent samples every partition and is too heavy to run
+    after each sync. Rows for a month without its own partition live in
+    transactions_default. Skipped for small incremental batches, which
+    autovacuum covers.
+    """
+    if records_synced < settings.sync_analyze_min_records:
+        return
+
+    try:
+        result = await session.execute(
+            text("SELECT coalesce(to_regclass(:name), 'transactions_default'::regclass)::text"),
+            {"name": transaction_partition_name(date.today())},
+        )
+        partition = result.scalar_one()
+        await session.execute(
+            text(f"ANALYZE {partition} ({', '.join(ANALYZE_COLUMNS)})")
+        )
+        await session.commit()
+        logger.info(
+            "transactions_analyzed",
+            partition=partition,
+            records_synced=records_synced,
+        )
+    except Exception as e:
+        await session.rollback()
+        logger.warning("transactions_analyze_failed", error=str(e))
+
+
+async def refresh_balance_hourly(session: AsyncSession) -> None:
+    """
+    Refresh the hourly balance view from payshack_balance_snapshots.
+
+    CONCURRENTLY keeps the view readable during the refresh; it relies on
+    the view's unique (entity_type, entity_id, bucket) index.
+    """
+    await session.execute(
+        text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {BALANCE_HOURLY_VIEW}")
+    )
+    await session.commit()
+    logger.info("balance_hourly_refreshed")
@@ -0,0 +1,105 @@
+"""Range partition maintenance.
+
+transactions is partitioned monthly by created_at and reconciliation_results
+daily by recon_date. Rows outside the created partitions land in the DEFAULT
+partition, so this job only has to keep partitions ahead of incoming data.
+The current month / day already has rows in DEFAULT, so only future ranges
+are created: attaching a populated range would scan DEFAULT and then fail.
+"""
+
+from datetime import date, timedelta
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import async_session_maker
+
+logger = structlog.get_logger()
+
+TXN_PARTITION_MONTHS_AHEAD = 3
+RECON_PARTITION_DAYS_AHEAD = 7
+
+
+def transaction_partition_name(d: date) -> str:
+    """Name of the monthly transactions partition covering d."""
+    return f"transactions_y{d.year}m{d.month:02d}"
+
+
+def _add_months(d: date, months: int) -> date:
+    month = d.month - 1 + months
+    return date(d.year + month // 12, month % 12 + 1, 1)
+
+
+async def _create_partition(
+    session: AsyncSession,
+    parent: str,
+    name: str,
+    start: str,
+    end: str,
+) -> bool:
+    """Create one range partition; returns False if it could not be attached."""
+    try:
+        async with session.begin_nested():
+            await session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {parent} "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                )
+            )
+        return True
+    except Exception as e:
+        # Typically the DEFAULT partition already holds rows for this range
+        logger.warning("partition_create_failed", partition=name, error=str(e))
+        return False
+
+
+async def ensure_transaction_partitions(
+    session: AsyncSession,
+    months_ahead: int = TXN_PARTITION_MONTHS_AHEAD,
+) -> int:
+    """Create monthly transactions partitions from next month onward."""
+    created = 0
+    first = date.today().replace(day=1)
+    for i in range(1, months_ahead + 1):
+        start = _add_months(first, i)
+        end = _add_months(first, i + 1)
+        if await _create_partition(
+            session,
+            "transactions",
+            transaction_partition_name(start),
+            f"{start.isoformat()} 00:00:00+00",
+            f"{end.isoformat()} 00:00:00+00",
+        ):
+            created += 1
+    return created
+
+
+async def ensure_reconciliation_partitions(
+    session: AsyncSession,
+    days_ahead: int = RECON_PARTITION_DAYS_AHEAD,
+) -> int:
+    """Create daily reconciliation_results partitions from tomorrow onward."""
+    created = 0
+    today = date.today()
+    for i in range(1, days_ahead + 1):
+        day = today + timedelta(days=i)
+        if await _create_partition(
+            session,
+            "reconciliation_results",
+            f"reconciliation_results_d{day.strftime('%Y%m%d')}",
+            day.isoformat(),
+            (day + timedelta(days=1)).isoformat(),
+        ):
+            created += 1
+    return created
+
+
+async def ensure_partitions() -> None:
+    """Scheduler entry point: keep future partitions in place."""
+    async with async_session_maker() as session:
+        txn = await ensure_transaction_partitions(session)
+        recon = await ensure_reconciliation_partitions(session)
+        await session.commit()
+
+    logger.info("partitions_ensured", transactions=txn, reconciliation_results=recon)
@@ -1,6 +1,6 @@
 """Redis connection management."""
 
-from typing import Optional
+from typing import Dict, List, Optional
 import redis.asyncio as redis
 from app.config import settings
 
@@ -53,6 +53,21 @@ class RedisCache:
         """Set value in cache with TTL."""
         await self.client.setex(key, ttl, value)
 
+    def pipeline(self):
+        """Non-transactional pipeline: queued commands share one round-trip."""
+        return self.client.pipeline(transaction=False)
+
+    async def get_many(self, *keys: str) -> List[Optional[str]]:
+        """Get several values in one round-trip."""
+        return await self.client.mget(keys)
+
+    async def set_many(self, values: Dict[str, str], ttl: int = 60) -> None:
+        """Set several values with the same TTL in one round-trip."""
+        async with self.pipeline() as pipe:
+            for key, value in values.items():
+                pipe.setex(key, ttl, value)
+            await pipe.execute()
+
     async def delete(self, key: str) -> None:
         """Delete key from cache."""
         await self.client.delete(key)
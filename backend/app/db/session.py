@@ -1,7 +1,8 @@
 """Database session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -11,6 +12,12 @@ from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
+
+def json_dumps(value: Any) -> str:
+    """Serialize JSON/JSONB values (raw API payloads) with orjson."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
@@ -18,6 +25,8 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 # Session factory
@@ -0,0 +1,119 @@
+"""Staged bulk upserts for ingestion.
+
+Sync batches are COPYed into a session-local staging table and merged into
+transactions with a single INSERT ... SELECT ... ON CONFLICT. The staging
+table is TEMP, so it is never WAL-logged, has no indexes to maintain during
+COPY, and concurrent syncs (Vima, PayShack, historical loads) cannot see or
+truncate each other's rows.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import json_dumps
+from app.models.transaction import Transaction
+
+STAGE_TABLE = "transactions_stage"
+
+# Filled by the COPY in batch order; the highest value per key wins the merge
+STAGE_SEQ = "stage_seq"
+
+# Fixed-point copies derived from the staged amounts during the merge
+MICROS_COLUMNS = {
+    "amount_micros": "amount",
+    "amount_usd_micros": "amount_usd",
+}
+
+# id and ingested_at come from column defaults; micros are derived
+STAGE_COLUMNS = tuple(
+    c.name
+    for c in Transaction.__table__.columns
+    if c.name not in ("id", "ingested_at") and c.name not in MICROS_COLUMNS
+)
+
+CONFLICT_COLUMNS = ("source", "source_id", "created_at")
+
+
+def _record(row: Dict[str, Any]) -> tuple:
+    values = []
+    for column in STAGE_COLUMNS:
+        value = row.get(column)
+        if column == "raw_data" and value is not None:
+            # The connection's jsonb codec takes serialized text
+            value = json_dumps(value)
+        values.append(value)
+    return tuple(values)
+
+
+async def stage_upsert_transactions(
+    session: AsyncSession,
+    rows: List[Dict[str, Any]],
+    update_columns: Sequence[str],
+) -> Tuple[int, int]:
+    """
+    Bulk upsert normalized transactions via COPY into a staging table.
+
+    Args:
+        session: Active session; the merge runs in its transaction
+        rows: Normalized transaction dicts
+        update_columns: Columns refreshed from the new row on conflict
+
+    Returns:
+        (inserted, updated) row counts
+    """
+    if not rows:
+        return 0, 0
+
+    await session.execute(
+        text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} "
+            f"(LIKE transactions INCLUDING DEFAULTS, {STAGE_SEQ} bigserial) "
+            f"ON COMMIT DELETE ROWS"
+        )
+    )
+
+    # COPY (binary) through the underlying asyncpg connection
+    conn = await session.connection()
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.copy_records_to_table(
+        STAGE_TABLE,
+        records=[_record(row) for row in rows],
+        columns=list(STAGE_COLUMNS),
+    )
+
+    # Numeric(18, 4) * 10_000 is always integral, so the cast is exact
+    micros = {
+        target: f"({source} * 10000)::bigint"
+        for target, source in MICROS_COLUMNS.items()
+    }
+    columns = ", ".join((*STAGE_COLUMNS, *micros))
+    values = ", ".join((*STAGE_COLUMNS, *micros.values()))
+    keys = ", ".join(CONFLICT_COLUMNS)
+    refreshed = [
+        *update_columns,
+        *(t for t, s in MICROS_COLUMNS.items() if s in update_columns),
+    ]
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in refreshed)
+
+    # DISTINCT ON: a key repeated within one batch may only be merged once,
+    # and the last occurrence in the batch is the one kept. xmax is 0 only
+    # on freshly inserted row versions.
+    result = await session.execute(
+        text(
+            f"WITH merged AS ("
+            f"INSERT INTO transactions ({columns}) "
+            f"SELECT DISTINCT ON ({keys}) {values} FROM {STAGE_TABLE} "
+            f"ORDER BY {keys}, {STAGE_SEQ} DESC "
+            f"ON CONFLICT ({keys}) DO UPDATE SET {updates} "
+            f"RETURNING (xmax = 0) AS inserted"
+            f") "
+            f"SELECT count(*) FILTER (WHERE inserted) AS inserted, "
+            f"count(*) FILTER (WHERE NOT inserted) AS updated FROM merged"
+        )
+    )
+    counts = result.one()
+    await session.execute(text(f"TRUNCATE {STAGE_TABLE}"))
+
+    return counts.inserted, counts.updated
@@ -8,11 +8,11 @@ from datetime import datetime, timezone
 from typing import Optional
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import async_session_factory
+from app.db.session import async_session_maker
 from app.db.redis import cache
 from app.integrations.payshack import PayShackClient, payshack_client
 from app.models.payshack_metadata import (
@@ -53,7 +53,7 @@ async def sync_payshack_clients(client: Optional[PayShackClient] = None) -> dict
             logger.warning("payshack_clients_sync_empty")
             return stats
         
-        async with async_session_factory() as db:
+        async with async_session_maker() as db:
             for client_data in clients_data:
                 try:
                     client_id = (
@@ -80,7 +80,7 @@ async def sync_payshack_clients(client: Optional[PayShackClient] = None) -> dict
                         currency="INR",
                         commission_rate=client_data.get("commissionRate"),
                         raw_data=client_data,
-                        synced_at=datetime.now(timezone.utc),
+                        synced_at=func.now(),
                     ).on_conflict_do_update(
                         index_elements=["client_id"],
                         set_={
@@ -93,8 +93,8 @@ async def sync_payshack_clients(client: Optional[PayShackClient] = None) -> dict
                             "wallet_balance": client_data.get("walletBalance") or 0,
                             "commission_rate": client_data.get("commissionRate"),
                             "raw_data": client_data,
-                            "updated_at": datetime.now(timezone.utc),
-                            "synced_at": datetime.now(timezone.utc),
+                            "updated_at": func.now(),
+                            "synced_at": func.now(),
                         }
                     )
                     
@@ -151,7 +151,7 @@ async def sync_payshack_resellers(client: Optional[PayShackClient] = None) -> di
             logger.warning("payshack_resellers_sync_empty")
             return stats
         
-        async with async_session_factory() as db:
+        async with async_session_maker() as db:
             for reseller_data in resellers_data:
                 try:
                     reseller_id = (
@@ -174,7 +174,7 @@ async def sync_payshack_resellers(client: Optional[PayShackClient] = None) -> di
                         balance=reseller_data.get("balance") or 0,
                         currency="INR",
                         raw_data=reseller_data,
-                        synced_at=datetime.now(timezone.utc),
+                        synced_at=func.now(),
                     ).on_conflict_do_update(
                         index_elements=["reseller_id"],
                         set_={
@@ -185,8 +185,8 @@ async def sync_payshack_resellers(client: Optional[PayShackClient] = None) -> di
                             "is_active": reseller_data.get("isActive", True),
                             "balance": reseller_data.get("balance") or 0,
                             "raw_data": reseller_data,
-                            "updated_at": datetime.now(timezone.utc),
-                            "synced_at": datetime.now(timezone.utc),
+                            "updated_at": func.now(),
+                            "synced_at": func.now(),
                         }
                     )
                     
@@ -231,7 +231,7 @@ async def sync_payshack_service_providers(client: Optional[PayShackClient] = Non
             logger.warning("payshack_providers_sync_empty")
             return stats
         
-        async with async_session_factory() as db:
+        async with async_session_maker() as db:
             for provider_data in providers_data:
                 try:
                     provider_id = (
@@ -252,7 +252,7 @@ async def sync_payshack_service_providers(client: Optional[PayShackClient] = Non
                         supports_payin=provider_data.get("supportsPayin", True),
                         supports_payout=provider_data.get("supportsPayout", True),
                         raw_data=provider_data,
-                        synced_at=datetime.now(timezone.utc),
+                        synced_at=func.now(),
                     ).on_conflict_do_update(
                         index_elements=["provider_id"],
                         set_={
@@ -263,8 +263,8 @@ async def sync_payshack_service_providers(client: Optional[PayShackClient] = Non
                             "supports_payin": provider_data.get("supportsPayin", True),
                             "supports_payout": provider_data.get("supportsPayout", True),
                             "raw_data": provider_data,
-                            "updated_at": datetime.now(timezone.utc),
-                            "synced_at": datetime.now(timezone.utc),
+                            "updated_at": func.now(),
+                            "synced_at": func.now(),
                         }
                     )
                     
@@ -294,40 +294,36 @@ async def create_balance_snapshots() -> dict:
     
     stats = {"created": 0, "errors": 0}
     now = datetime.now(timezone.utc)
+    columns = ["entity_type", "entity_id", "entity_name", "balance", "currency", "snapshot_at"]
     
-    async with async_session_factory() as db:
+    # Balances are already in Postgres: copy them server-side with
+    # INSERT ... SELECT instead of loading rows into ORM objects
+    sources = (
+        select(
+            literal("client"),
+            PayShackClientModel.client_id,
+            PayShackClientModel.name,
+            func.coalesce(PayShackClientModel.balance, 0),
+            literal("INR"),
+            literal(now),
+        ),
+        select(
+            literal("reseller"),
+            PayShackReseller.reseller_id,
+            PayShackReseller.name,
+            func.coalesce(PayShackReseller.balance, 0),
+            literal("INR"),
+            literal(now),
+        ),
+    )
+    
+    async with async_session_maker() as db:
         try:
-            # Snapshot client balances
-            result = await db.execute(select(PayShackClientModel))
-            clients = result.scalars().all()
-            
-            for client in clients:
-                snapshot = PayShackBalanceSnapshot(
-                    entity_type="client",
-                    entity_id=client.client_id,
-                    entity_name=client.name,
-                    balance=client.balance or 0,
-                    currency="INR",
-                    snapshot_at=now,
-                )
-                db.add(snapshot)
-                stats["created"] += 1
-            
-            # Snapshot reseller balances
-            result = await db.execute(select(PayShackReseller))
-            resellers = result.scalars().all()
-            
-            for reseller in resellers:
-                snapshot = PayShackBalanceSnapshot(
-                    entity_type="reseller",
-                    entity_id=reseller.reseller_id,
-                    entity_name=reseller.name,
-                    balance=reseller.balance or 0,
-                    currency="INR",
-                    snapshot_at=now,
+            for source in sources:
+                result = await db.execute(
+                    insert(PayShackBalanceSnapshot).from_select(columns, source)
                 )
-                db.add(snapshot)
-                stats["created"] += 1
+                stats["created"] += result.rowcount
             
             await db.commit()
             
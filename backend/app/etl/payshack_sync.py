@@ -9,12 +9,13 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List, Optional
 
 import structlog
-from sqlalchemy import select, text
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func, select, text, update
 
+from app.db.maintenance import analyze_transactions
+from app.db.staging import stage_upsert_transactions
+from app.etl.progress import SyncProgress
 from app.db.session import async_session_maker
 from app.models.sync_state import SyncState
-from app.models.transaction import Transaction
 from app.integrations.payshack.client import PayShackClient, PayShackAPIError
 from app.integrations.payshack.normalizer import PayShackNormalizer
 from app.api.websocket import (
@@ -54,6 +55,7 @@ class PayShackSyncService:
         total_new = 0
         total_updated = 0
         errors = []
+        progress = SyncProgress(self.source)
 
         async with async_session_maker() as session:
             try:
@@ -74,7 +76,7 @@ class PayShackSyncService:
                 
                 # Sync Pay-In transactions
                 payin_result = await self._sync_payin_transactions(
-                    session, last_sync if not full_sync else None
+                    session, progress, last_sync if not full_sync else None
                 )
                 total_synced += payin_result["synced"]
                 total_new += payin_result["new"]
@@ -84,7 +86,7 @@ class PayShackSyncService:
 
                 # Sync Pay-Out transactions
                 payout_result = await self._sync_payout_transactions(
-                    session, last_sync if not full_sync else None
+                    session, progress, last_sync if not full_sync else None
                 )
                 total_synced += payout_result["synced"]
                 total_new += payout_result["new"]
@@ -97,9 +99,11 @@ class PayShackSyncService:
                     session,
                     sync_status="idle",
                     last_sync_at=datetime.now(timezone.utc),
+                    records_synced=total_synced,
                     error_message=None,
                 )
                 await session.commit()
+                await analyze_transactions(session, total_synced)
 
                 elapsed = time.time() - start_time
                 
@@ -161,6 +165,7 @@ class PayShackSyncService:
     async def _sync_payin_transactions(
         self,
         session,
+        progress: SyncProgress,
         since: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Sync Pay-In transactions."""
@@ -206,6 +211,7 @@ class PayShackSyncService:
                     synced += batch_result["total"]
                     new += batch_result["inserted"]
                     updated += batch_result["updated"]
+                    await progress.advance(session, batch_result["total"])
                 
                 # Broadcast progress
                 await broadcast_sync_progress(
@@ -248,6 +254,7 @@ class PayShackSyncService:
     async def _sync_payout_transactions(
         self,
         session,
+        progress: SyncProgress,
         since: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Sync Pay-Out transactions."""
@@ -290,6 +297,7 @@ class PayShackSyncService:
                     synced += batch_result["total"]
                     new += batch_result["inserted"]
                     updated += batch_result["updated"]
+                    await progress.advance(session, batch_result["total"])
                 
                 total_pages = result.get("totalPages", 1)
                 if page >= total_pages:
@@ -325,71 +333,32 @@ class PayShackSyncService:
         transactions: List[Dict[str, Any]],
     ) -> Dict[str, int]:
         """
-        Upsert transactions using ON CONFLICT.
+        Upsert transactions using a staged ON CONFLICT merge.
         
         Returns count of inserted and updated records.
         """
         if not transactions:
             return {"total": 0, "inserted": 0, "updated": 0}
         
-        inserted = 0
-        updated = 0
-        
-        for txn in transactions:
-            stmt = insert(Transaction).values(
-                source=txn["source"],
-                source_id=txn["source_id"],
-                reference_id=txn.get("reference_id"),
-                client_operation_id=txn.get("client_operation_id"),
-                order_id=txn.get("order_id"),
-                project=txn.get("project"),
-                merchant_id=txn.get("merchant_id"),
-                amount=txn["amount"],
-                currency=txn["currency"],
-                amount_usd=txn.get("amount_usd"),
-                fee=txn.get("fee"),
-                fee_usd=txn.get("fee_usd"),
-                exchange_rate=txn.get("exchange_rate"),
-                status=txn["status"],
-                original_status=txn.get("original_status"),
-                user_id=txn.get("user_id"),
-                user_email=txn.get("user_email"),
-                user_phone=txn.get("user_phone"),
-                user_name=txn.get("user_name"),
-                country=txn.get("country"),
-                utr=txn.get("utr"),
-                payment_method=txn.get("payment_method"),
-                payment_product=txn.get("payment_product"),
-                created_at=txn["created_at"],
-                updated_at=txn.get("updated_at"),
-                completed_at=txn.get("completed_at"),
-                source_create_cursor=txn.get("source_create_cursor"),
-                source_update_cursor=txn.get("source_update_cursor"),
-                raw_data=txn.get("raw_data"),
-                data_hash=txn["data_hash"],
-            ).on_conflict_do_update(
-                index_elements=["data_hash"],
-                set_={
-                    "status": txn["status"],
-                    "original_status": txn.get("original_status"),
-                    "updated_at": txn.get("updated_at"),
-                    "completed_at": txn.get("completed_at"),
-                    "utr": txn.get("utr"),
-                    "amount_usd": txn.get("amount_usd"),
-                    "fee_usd": txn.get("fee_usd"),
-                    "exchange_rate": txn.get("exchange_rate"),
-                    "raw_data": txn.get("raw_data"),
-                    "ingested_at": datetime.now(timezone.utc),
-                }
-            )
-            
-            result = await session.execute(stmt)
-            
-            # Check if inserted or updated
-            if result.rowcount > 0:
-                # Simple heuristic - if ingested_at was just set, it was an upsert
-                # For accurate count, we'd need RETURNING clause
-                inserted += 1
+        inserted, updated = await stage_upsert_transactions(
+            session,
+            transactions,
+            update_columns=(
+                "status",
+                "original_status",
+                "updated_at",
+                "completed_at",
+                "utr",
+                "amount_usd",
+                "fee_usd",
+                "exchange_rate",
+                "raw_data",
+                "amount",
+                "currency",
+                "data_hash",
+                "ingested_at",  # EXCLUDED carries the NOW() default
+            ),
+        )
         
         await session.commit()
         
@@ -427,20 +396,14 @@ class PayShackSyncService:
         return state
 
     async def _update_sync_state(self, session, **kwargs):
-        """Update sync state."""
+        """Update sync state with a single-row UPDATE, creating it if missing."""
         result = await session.execute(
-            select(SyncState).where(SyncState.source == self.source)
+            update(SyncState)
+            .where(SyncState.source == self.source)
+            .values(**kwargs, updated_at=func.now())
         )
-        state = result.scalar_one_or_none()
-        
-        if state:
-            for key, value in kwargs.items():
-                if hasattr(state, key):
-                    setattr(state, key, value)
-            state.updated_at = datetime.now(timezone.utc)
-        else:
-            state = SyncState(source=self.source, **kwargs)
-            session.add(state)
+        if result.rowcount == 0:
+            session.add(SyncState(source=self.source, **kwargs))
 
     async def historical_sync(self, days: int = 7) -> Dict[str, Any]:
         """
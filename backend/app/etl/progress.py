@@ -0,0 +1,63 @@
+"""Throttled ETL progress reporting."""
+
+import time
+from typing import Any, Dict
+
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sync_state import SyncState
+
+# Write progress at most every N rows or T seconds, whichever comes first
+PROGRESS_EVERY_ROWS = 10_000
+PROGRESS_EVERY_SECONDS = 5.0
+
+
+class SyncProgress:
+    """
+    Accumulates sync progress in memory and writes it to sync_state in
+    occasional single-row UPDATEs instead of once per batch.
+
+    Values passed to advance() (e.g. a cursor) are held until the next write.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        every_rows: int = PROGRESS_EVERY_ROWS,
+        every_seconds: float = PROGRESS_EVERY_SECONDS,
+    ):
+        self.source = source
+        self.every_rows = every_rows
+        self.every_seconds = every_seconds
+        self.records = 0
+        self._pending: Dict[str, Any] = {}
+        self._flushed_records = 0
+        self._flushed_at = time.monotonic()
+
+    async def advance(self, session: AsyncSession, rows: int, **values: Any) -> None:
+        """Count processed rows and write progress if a threshold is reached."""
+        self.records += rows
+        self._pending.update(values)
+
+        if (
+            self.records - self._flushed_records >= self.every_rows
+            or time.monotonic() - self._flushed_at >= self.every_seconds
+        ):
+            await self.flush(session)
+
+    async def flush(self, session: AsyncSession) -> None:
+        """Write current progress and any pending values."""
+        await session.execute(
+            update(SyncState)
+            .where(SyncState.source == self.source)
+            .values(
+                records_synced=self.records,
+                last_heartbeat_at=func.now(),
+                updated_at=func.now(),
+                **self._pending,
+            )
+        )
+        self._pending = {}
+        self._flushed_records = self.records
+        self._flushed_at = time.monotonic()
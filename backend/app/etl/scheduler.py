@@ -62,6 +62,26 @@ async def start_scheduler():
         max_instances=1,
     )
     
+    # Keep transactions / reconciliation_results partitions ahead of data
+    _scheduler.add_job(
+        maintain_partitions,
+        trigger=IntervalTrigger(hours=12),
+        id="partition_maintenance",
+        name="Partition Maintenance",
+        replace_existing=True,
+        max_instances=1,
+    )
+    
+    # Roll balance snapshots up into payshack_balance_hourly
+    _scheduler.add_job(
+        refresh_balance_views,
+        trigger=IntervalTrigger(hours=1),
+        id="balance_hourly_refresh",
+        name="Balance Hourly Refresh",
+        replace_existing=True,
+        max_instances=1,
+    )
+    
     _scheduler.start()
     logger.info(
         "scheduler_started",
@@ -74,6 +94,9 @@ async def start_scheduler():
     # Pre-load currency rates at startup
     asyncio.create_task(refresh_currency_rates())
     
+    # Make sure current partitions exist before the first sync
+    asyncio.create_task(maintain_partitions())
+    
     # Run initial sync after short delay
     asyncio.create_task(initial_sync())
 
@@ -319,3 +342,25 @@ async def refresh_currency_rates():
             
     except Exception as e:
         logger.error("currency_rates_refresh_error", error=str(e))
+
+
+async def maintain_partitions():
+    """Create upcoming range partitions (runs at startup and every 12 hours)."""
+    from app.db.partitions import ensure_partitions
+    
+    try:
+        await ensure_partitions()
+    except Exception as e:
+        logger.error("partition_maintenance_failed", error=str(e))
+
+
+async def refresh_balance_views():
+    """Refresh the hourly balance materialized view (runs every hour)."""
+    from app.db.maintenance import refresh_balance_hourly
+    from app.db.session import async_session_maker
+    
+    try:
+        async with async_session_maker() as session:
+            await refresh_balance_hourly(session)
+    except Exception as e:
+        logger.error("balance_hourly_refresh_failed", error=str(e))
@@ -6,11 +6,12 @@ from datetime import date, datetime, timezone, timedelta
 from typing import Dict, Any, List
 
 import structlog
-from sqlalchemy import select, text
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func, select, text, update
 
+from app.db.maintenance import analyze_transactions
+from app.db.staging import stage_upsert_transactions
+from app.etl.progress import SyncProgress
 from app.db.session import async_session_maker
-from app.models.transaction import Transaction
 from app.models.sync_state import SyncState
 from app.integrations.vima.client import VimaClient, VimaAPIError
 from app.integrations.vima.normalizer import VimaNormalizer
@@ -51,6 +52,7 @@ class VimaSyncService:
         """
         start_time = time.time()
         records_synced = 0
+        progress = SyncProgress(self.source)
         
         async with async_session_maker() as session:
             try:
@@ -99,14 +101,17 @@ class VimaSyncService:
                         await self._upsert_transactions(session, normalized)
                         records_synced += len(normalized)
 
-                        # Update cursor to last record
+                        # Cursor and counters are written in batches; a lost
+                        # cursor only means re-fetching idempotent upserts
                         last_cursor = normalized[-1].get("source_create_cursor")
                         if last_cursor:
-                            await self._update_sync_state(
+                            await progress.advance(
                                 session,
+                                len(normalized),
                                 last_create_cursor=last_cursor,
-                                records_synced=records_synced,
                             )
+                        else:
+                            await progress.advance(session, len(normalized))
 
                         await session.commit()
 
@@ -124,7 +129,8 @@ class VimaSyncService:
                             total=records_synced,
                         )
 
-                # Mark sync as successful
+                # Persist the latest cursor, then mark sync as successful
+                await progress.flush(session)
                 duration_ms = int((time.time() - start_time) * 1000)
                 await self._update_sync_state(
                     session,
@@ -134,6 +140,7 @@ class VimaSyncService:
                     records_synced=records_synced,
                 )
                 await session.commit()
+                await analyze_transactions(session, records_synced)
 
                 # Broadcast completion
                 await broadcast_sync_completed(self.source, records_synced)
@@ -181,17 +188,12 @@ class VimaSyncService:
         return state
 
     async def _update_sync_state(self, session, **kwargs):
-        """Update sync state."""
-        result = await session.execute(
-            select(SyncState).where(SyncState.source == self.source)
+        """Update sync state with a single-row UPDATE."""
+        await session.execute(
+            update(SyncState)
+            .where(SyncState.source == self.source)
+            .values(**kwargs, updated_at=func.now())
         )
-        state = result.scalar_one_or_none()
-        
-        if state:
-            for key, value in kwargs.items():
-                if hasattr(state, key):
-                    setattr(state, key, value)
-            state.updated_at = datetime.now(timezone.utc)
 
     async def _upsert_transactions(
         self,
@@ -201,32 +203,32 @@ class VimaSyncService:
         """
         Upsert transactions with deduplication.
         
-        Uses ON CONFLICT DO UPDATE on data_hash.
+        Stages the batch with COPY and merges it with ON CONFLICT DO UPDATE
+        on the natural key (source, source_id, created_at).
         """
         if not transactions:
             return
 
-        # Build insert statement with ON CONFLICT
-        stmt = insert(Transaction).values(transactions)
-        
-        # On conflict (data_hash), update status, timestamps, and USD amounts
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["data_hash"],
-            set_={
-                "status": stmt.excluded.status,
-                "original_status": stmt.excluded.original_status,
-                "updated_at": stmt.excluded.updated_at,
-                "completed_at": stmt.excluded.completed_at,
-                "source_update_cursor": stmt.excluded.source_update_cursor,
-                "amount_usd": stmt.excluded.amount_usd,
-                "fee_usd": stmt.excluded.fee_usd,
-                "exchange_rate": stmt.excluded.exchange_rate,
-                "raw_data": stmt.excluded.raw_data,
-            },
+        # On conflict (natural key), update status, timestamps, and USD amounts
+        await stage_upsert_transactions(
+            session,
+            transactions,
+            update_columns=(
+                "status",
+                "original_status",
+                "updated_at",
+                "completed_at",
+                "source_update_cursor",
+                "amount_usd",
+                "fee_usd",
+                "exchange_rate",
+                "raw_data",
+                "amount",
+                "currency",
+                "data_hash",
+            ),
         )
 
-        await session.execute(stmt)
-
     async def historical_sync(self, days: int = 7) -> Dict[str, Any]:
         """
         Load historical data for specified number of days.
@@ -242,6 +244,7 @@ class VimaSyncService:
         """
         start_time = time.time()
         total_records = 0
+        progress = SyncProgress(self.source)
         
         logger.info("vima_historical_sync_starting", days=days)
         
@@ -266,7 +269,7 @@ class VimaSyncService:
                         day_offset=day_offset,
                     )
                     
-                    day_records = await self._sync_date(session, target_date)
+                    day_records = await self._sync_date(session, target_date, progress)
                     total_records += day_records
                     
                     await broadcast_sync_progress(
@@ -288,6 +291,7 @@ class VimaSyncService:
                     records_synced=total_records,
                 )
                 await session.commit()
+                await analyze_transactions(session, total_records)
                 
                 await broadcast_sync_completed(self.source, total_records)
                 
@@ -321,7 +325,12 @@ class VimaSyncService:
                     "records_synced": total_records,
                 }
 
-    async def _sync_date(self, session, target_date: date) -> int:
+    async def _sync_date(
+        self,
+        session,
+        target_date: date,
+        progress: SyncProgress,
+    ) -> int:
         """
         Sync all operations for a specific date.
         
@@ -364,6 +373,7 @@ class VimaSyncService:
                 if normalized:
                     await self._upsert_transactions(session, normalized)
                     records_synced += len(normalized)
+                    await progress.advance(session, len(normalized))
                     
                     # Update cursor for next page
                     last_cursor = normalized[-1].get("source_create_cursor")
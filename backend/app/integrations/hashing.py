@@ -0,0 +1,8 @@
+"""Row hashing shared by the source normalizers."""
+
+import hashlib
+
+
+def blake2b_hex(data: bytes) -> str:
+    """64-char hex digest, the width of transactions.data_hash."""
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
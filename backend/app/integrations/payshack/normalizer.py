@@ -1,12 +1,12 @@
 """PayShack data normalizer."""
 
-import hashlib
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Callable, ClassVar, Dict, Any, Optional
 
 import structlog
 
+from app.integrations.hashing import blake2b_hex
 from app.services.currency import currency_service
 
 logger = structlog.get_logger()
@@ -15,7 +15,7 @@ logger = structlog.get_logger()
 IST_OFFSET = timedelta(hours=5, minutes=30)
 
 # Default INR to USD rate (fallback)
-DEFAULT_INR_USD_RATE = 0.012
+DEFAULT_INR_USD_RATE = Decimal("0.012")
 
 
 class PayShackNormalizer:
@@ -30,8 +30,11 @@ class PayShackNormalizer:
     - clientName -> project
     """
 
+    # Stateless; the module singleton carries no per-instance dict
+    __slots__ = ()
+
     # Status mapping: PayShack -> unified
-    STATUS_MAP = {
+    STATUS_MAP: ClassVar[Dict[str, str]] = {
         "success": "success",
         "failed": "failed",
         "initiated": "pending",
@@ -45,7 +48,7 @@ class PayShackNormalizer:
     }
 
     # Client name to project mapping
-    CLIENT_PROJECT_MAP = {
+    CLIENT_PROJECT_MAP: ClassVar[Dict[str, str]] = {
         "91G_TECH_PVT_LTD": "91game",
         "91g_tech_pvt_ltd": "91game",
         "IG Indigate P_Out": "indigate_payout",
@@ -53,6 +56,9 @@ class PayShackNormalizer:
         "Mn CL THREE_PVT_LTD": "mncl_three",
     }
 
+    # Digest for data_hash; replaceable in tests
+    hasher: ClassVar[Callable[[bytes], str]] = staticmethod(blake2b_hex)
+
     @classmethod
     def normalize_payin(cls, raw: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -87,7 +93,7 @@ class PayShackNormalizer:
 
             # Convert to USD using sync method (rate from static fallback)
             fee = cls._extract_fee(raw)
-            inr_rate = currency_service.STATIC_RATES_TO_USD.get("INR", DEFAULT_INR_USD_RATE)
+            inr_rate = currency_service.STATIC_RATES_TO_USD_DECIMAL.get("INR", DEFAULT_INR_USD_RATE)
             amount_usd = currency_service.convert_sync(amount, "INR", inr_rate)
             fee_usd = currency_service.convert_sync(fee, "INR", inr_rate) if fee else None
 
@@ -104,7 +110,7 @@ class PayShackNormalizer:
                 "amount_usd": amount_usd,
                 "fee": fee,
                 "fee_usd": fee_usd,
-                "exchange_rate": Decimal(str(inr_rate)),
+                "exchange_rate": inr_rate,
                 "status": status,
                 "original_status": original_status,
                 "user_id": None,
@@ -166,7 +172,7 @@ class PayShackNormalizer:
 
             # Convert to USD
             fee = cls._extract_fee(raw)
-            inr_rate = currency_service.STATIC_RATES_TO_USD.get("INR", DEFAULT_INR_USD_RATE)
+            inr_rate = currency_service.STATIC_RATES_TO_USD_DECIMAL.get("INR", DEFAULT_INR_USD_RATE)
             amount_usd = currency_service.convert_sync(amount, "INR", inr_rate)
             fee_usd = currency_service.convert_sync(fee, "INR", inr_rate) if fee else None
 
@@ -183,7 +189,7 @@ class PayShackNormalizer:
                 "amount_usd": amount_usd,
                 "fee": fee,
                 "fee_usd": fee_usd,
-                "exchange_rate": Decimal(str(inr_rate)),
+                "exchange_rate": inr_rate,
                 "status": status,
                 "original_status": original_status,
                 "user_id": None,
@@ -262,7 +268,7 @@ class PayShackNormalizer:
             f"{normalized['currency']}|"
             f"{created_str}"
         )
-        return hashlib.sha256(hash_input.encode()).hexdigest()[:64]
+        return cls.hasher(hash_input.encode())
 
 
 # Singleton instance
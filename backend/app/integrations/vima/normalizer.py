@@ -1,13 +1,13 @@
 """Vima data normalizer."""
 
-import hashlib
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Callable, ClassVar, Dict, Any, Optional
 from dateutil import parser as date_parser
 
 import structlog
 
+from app.integrations.hashing import blake2b_hex
 from app.services.currency import currency_service
 
 logger = structlog.get_logger()
@@ -24,8 +24,11 @@ class VimaNormalizer:
     - current_status/payment_status -> status (normalized)
     """
 
+    # Stateless; the module singleton carries no per-instance dict
+    __slots__ = ()
+
     # Status mapping: Vima -> unified
-    STATUS_MAP = {
+    STATUS_MAP: ClassVar[Dict[str, str]] = {
         "success": "success",
         "fail": "failed",
         "failed": "failed",
@@ -35,6 +38,9 @@ class VimaNormalizer:
         "pending": "pending",
     }
 
+    # Digest for data_hash; replaceable in tests
+    hasher: ClassVar[Callable[[bytes], str]] = staticmethod(blake2b_hex)
+
     @classmethod
     def normalize(cls, raw: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -208,7 +214,7 @@ class VimaNormalizer:
             f"{normalized['currency']}|"
             f"{normalized['created_at'].isoformat() if normalized['created_at'] else ''}"
         )
-        return hashlib.sha256(hash_input.encode()).hexdigest()[:64]
+        return cls.hasher(hash_input.encode())
 
 
 # Singleton instance
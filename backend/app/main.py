@@ -7,6 +7,7 @@ from typing import AsyncGenerator
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router as api_router
 from app.api.websocket import router as ws_router
@@ -15,6 +16,7 @@ from app.config import settings
 from app.db.session import init_db, close_db
 from app.db.redis import init_redis, close_redis
 from app.etl.scheduler import start_scheduler, stop_scheduler
+from app.services.currency import currency_service
 
 # Configure structured logging
 structlog.configure(
@@ -56,6 +58,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Cleanup
     logger.info("shutting_down_application")
     await stop_scheduler()
+    await currency_service.close()
     await close_redis()
     await close_db()
     logger.info("application_stopped")
@@ -66,6 +69,7 @@ app = FastAPI(
     description="PSP Dashboard Backend API - Aggregates payment data from Vima and PayShack",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
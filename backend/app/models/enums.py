@@ -0,0 +1,22 @@
+"""Postgres ENUM types for low-cardinality columns.
+
+Each value list is shared by the column type and by the Literal used to
+validate API filters, so an unknown value is rejected with a 422 instead of
+failing the enum cast in Postgres.
+"""
+
+from typing import Literal
+
+from sqlalchemy.dialects.postgresql import ENUM
+
+TXN_SOURCES = ("vima", "payshack")
+TXN_STATUSES = ("success", "failed", "pending", "processing", "refunded")
+MATCH_STATUSES = ("matched", "discrepancy", "missing_vima", "missing_payshack")
+
+TxnSource = Literal["vima", "payshack"]
+TxnStatus = Literal["success", "failed", "pending", "processing", "refunded"]
+MatchStatus = Literal["matched", "discrepancy", "missing_vima", "missing_payshack"]
+
+txn_source_enum = ENUM(*TXN_SOURCES, name="txn_source")
+txn_status_enum = ENUM(*TXN_STATUSES, name="txn_status")
+match_status_enum = ENUM(*MATCH_STATUSES, name="match_status")
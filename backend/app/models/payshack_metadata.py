@@ -4,8 +4,6 @@ Stores PayShack clients, balances, and service providers
 for dashboard analytics.
 """
 
-import uuid
-from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
@@ -17,6 +15,8 @@ from sqlalchemy import (
     Boolean,
     Text,
     Index,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
@@ -32,11 +32,15 @@ class PayShackClient(Base):
     
     __tablename__ = "payshack_clients"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     
     # PayShack identifiers
     client_id = Column(String(100), unique=True, nullable=False, index=True)
-    reseller_id = Column(String(100), nullable=True, index=True)
+    reseller_id = Column(String(100), nullable=True)
     
     # Client info
     name = Column(String(255), nullable=False)
@@ -59,13 +63,28 @@ class PayShackClient(Base):
     raw_data = Column(JSONB, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
-    synced_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    synced_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
-        Index("ix_payshack_clients_reseller", "reseller_id"),
-        Index("ix_payshack_clients_status", "status"),
+        # Dashboards list active clients; inactive rows stay out of the index
+        Index(
+            "ix_payshack_clients_reseller_active",
+            "reseller_id",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_payshack_clients_status_active",
+            "status",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_payshack_clients_raw_gin",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -78,7 +97,11 @@ class PayShackReseller(Base):
     
     __tablename__ = "payshack_resellers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     
     # PayShack identifiers
     reseller_id = Column(String(100), unique=True, nullable=False, index=True)
@@ -101,9 +124,18 @@ class PayShackReseller(Base):
     raw_data = Column(JSONB, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
-    synced_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    synced_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_payshack_resellers_raw_gin",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
+    )
 
 
 class PayShackServiceProvider(Base):
@@ -115,7 +147,11 @@ class PayShackServiceProvider(Base):
     
     __tablename__ = "payshack_service_providers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     
     # PayShack identifiers
     provider_id = Column(String(100), unique=True, nullable=False, index=True)
@@ -136,9 +172,18 @@ class PayShackServiceProvider(Base):
     raw_data = Column(JSONB, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
-    synced_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    synced_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_payshack_service_providers_raw_gin",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
+    )
 
 
 class PayShackBalanceSnapshot(Base):
@@ -150,11 +195,15 @@ class PayShackBalanceSnapshot(Base):
     
     __tablename__ = "payshack_balance_snapshots"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
     
     # Reference
     entity_type = Column(String(50), nullable=False)  # "client" or "reseller"
-    entity_id = Column(String(100), nullable=False, index=True)
+    entity_id = Column(String(100), nullable=False)
     entity_name = Column(String(255), nullable=True)
     
     # Balance
@@ -162,9 +211,21 @@ class PayShackBalanceSnapshot(Base):
     currency = Column(String(10), default="INR")
     
     # Timestamp
-    snapshot_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True)
+    snapshot_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     __table_args__ = (
-        Index("ix_balance_snapshots_entity", "entity_type", "entity_id"),
-        Index("ix_balance_snapshots_time", "snapshot_at"),
+        # INCLUDE serves "latest balance per entity" from the index alone
+        Index(
+            "ix_balance_snapshots_entity",
+            "entity_type",
+            "entity_id",
+            postgresql_include=["snapshot_at", "balance"],
+        ),
+        # Append-only, so snapshot_at follows heap order and BRIN suffices
+        Index(
+            "ix_balance_snapshots_time_brin",
+            "snapshot_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32, "autosummarize": "on"},
+        ),
     )
@@ -19,6 +19,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.db.session import Base
+from app.models.enums import match_status_enum
 
 
 class ReconciliationRun(Base):
@@ -53,7 +54,11 @@ class ReconciliationRun(Base):
 
 
 class ReconciliationResult(Base):
-    """Individual reconciliation results."""
+    """
+    Individual reconciliation results.
+
+    Partitioned daily by recon_date (see app.db.partitions).
+    """
 
     __tablename__ = "reconciliation_results"
 
@@ -69,9 +74,8 @@ class ReconciliationResult(Base):
         UUID(as_uuid=True),
         ForeignKey("reconciliation_runs.id"),
         nullable=False,
-        index=True,
     )
-    recon_date = Column(Date, nullable=False, index=True)
+    recon_date = Column(Date, primary_key=True, nullable=False)
 
     # Transaction references
     vima_txn_id = Column(UUID(as_uuid=True))
@@ -79,7 +83,7 @@ class ReconciliationResult(Base):
     client_operation_id = Column(String(255), index=True)
 
     # Match result
-    match_status = Column(String(30), nullable=False, index=True)
+    match_status = Column(match_status_enum, nullable=False, index=True)
     # Values: matched | discrepancy | missing_vima | missing_payshack
 
     # Discrepancy details
@@ -94,7 +98,7 @@ class ReconciliationResult(Base):
     payshack_status = Column(String(30))
 
     # Additional details
-    details = Column(JSONB)
+    details = Column(JSONB(none_as_null=True))  # None is stored as SQL NULL
 
     # Timestamps
     created_at = Column(
@@ -105,6 +109,20 @@ class ReconciliationResult(Base):
 
     __table_args__ = (
         Index("idx_recon_date_status", "recon_date", "match_status"),
+        # Per-run summary counts (index-only GROUP BY match_status)
+        Index(
+            "idx_recon_results_run_status",
+            "recon_run_id",
+            "match_status",
+            postgresql_include=["id"],
+        ),
+        Index(
+            "idx_recon_results_date_brin",
+            "recon_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32, "autosummarize": "on"},
+        ),
+        {"postgresql_partition_by": "RANGE (recon_date)"},
     )
 
     def __repr__(self) -> str:
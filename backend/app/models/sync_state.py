@@ -23,6 +23,7 @@ class SyncState(Base):
     # Timestamps
     last_sync_at = Column(DateTime(timezone=True))
     last_successful_sync = Column(DateTime(timezone=True))
+    last_heartbeat_at = Column(DateTime(timezone=True))  # last progress write
 
     # Status
     sync_status = Column(String(20), default="idle")  # idle | running | failed
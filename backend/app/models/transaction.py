@@ -6,20 +6,27 @@ from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     String,
     Numeric,
     DateTime,
     Index,
+    UniqueConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.db.session import Base
+from app.models.enums import txn_source_enum, txn_status_enum
 
 
 class Transaction(Base):
-    """Unified transaction model for all sources."""
+    """
+    Unified transaction model for all sources.
+
+    Partitioned monthly by created_at (see app.db.partitions).
+    """
 
     __tablename__ = "transactions"
 
@@ -32,7 +39,7 @@ class Transaction(Base):
     )
 
     # Source identification
-    source = Column(String(20), nullable=False, index=True)  # 'vima' | 'payshack'
+    source = Column(txn_source_enum, nullable=False)  # 'vima' | 'payshack'
     source_id = Column(String(255), nullable=False)  # Original ID from source
 
     # Matching keys
@@ -50,12 +57,17 @@ class Transaction(Base):
     fee = Column(Numeric(18, 4))
     
     # USD conversion
-    amount_usd = Column(Numeric(18, 4))  # Amount in USD
+    amount_usd = Column(Numeric(18, 4), nullable=False)  # Amount in USD, fixed at ingest
     fee_usd = Column(Numeric(18, 4))  # Fee in USD
     exchange_rate = Column(Numeric(12, 8))  # Rate used for conversion
 
+    # Fixed-point copies (units of 1/10_000) for integer aggregation;
+    # filled from amount / amount_usd by app.db.staging at ingest
+    amount_micros = Column(BigInteger)
+    amount_usd_micros = Column(BigInteger)
+
     # Status
-    status = Column(String(30), nullable=False, index=True)  # success | failed | pending
+    status = Column(txn_status_enum, nullable=False, index=True)  # success | failed | pending | ...
     original_status = Column(String(50))  # Original from source
 
     # Payer info
@@ -73,7 +85,8 @@ class Transaction(Base):
     payment_product = Column(String(100))
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Partition key, so part of the primary key
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False)
     updated_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
 
@@ -84,8 +97,8 @@ class Transaction(Base):
     # Raw data storage
     raw_data = Column(JSONB)
 
-    # Deduplication
-    data_hash = Column(String(64), unique=True, index=True)
+    # Change detection (natural key is source + source_id)
+    data_hash = Column(String(64))
 
     # System timestamps
     ingested_at = Column(
@@ -95,12 +108,40 @@ class Transaction(Base):
         server_default=text("NOW()"),
     )
 
-    # Indexes
+    # Indexes (unique constraints must include the partition key)
     __table_args__ = (
+        UniqueConstraint("source", "source_id", "created_at", name="uq_txn_source_source_id"),
         Index("idx_txn_source_date", "source", "created_at"),
-        Index("idx_txn_source_source_id", "source", "source_id"),
         Index("idx_txn_project_status", "project", "status"),
-        Index("idx_txn_created_desc", created_at.desc()),
+        Index("idx_txn_created_id", created_at.desc(), id.desc()),  # keyset pagination
+        # Covering indexes for reconciliation's per-source day scans
+        Index(
+            "idx_txn_recon_vima",
+            "created_at",
+            "client_operation_id",
+            postgresql_include=["amount", "status", "order_id", "id"],
+            postgresql_where=text("source = 'vima'"),
+        ),
+        Index(
+            "idx_txn_recon_payshack",
+            "created_at",
+            "client_operation_id",
+            postgresql_include=["amount", "status", "order_id", "id"],
+            postgresql_where=text("source = 'payshack'"),
+        ),
+        Index(
+            "idx_txn_status_amount_usd",
+            "status",
+            "created_at",
+            postgresql_include=["amount_usd"],
+        ),
+        Index(
+            "ix_txn_raw_gin",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,27 @@
+"""Module-level TypeAdapters for hot response paths.
+
+Adapters are built once at import. Endpoints that use them return a
+pre-serialized Response, which FastAPI passes through without validating
+it against response_model again; response_model stays on the route for the
+OpenAPI schema.
+"""
+
+from typing import Any, List
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.schemas.metrics import MetricsOverview
+from app.schemas.reconciliation import DiscrepancyListResponse, DiscrepancyResponse
+from app.schemas.transaction import TransactionListResponse, TransactionResponse
+
+TXN_LIST_ADAPTER = TypeAdapter(List[TransactionResponse])
+TXN_LIST_RESPONSE_ADAPTER = TypeAdapter(TransactionListResponse)
+DISCREPANCY_LIST_ADAPTER = TypeAdapter(List[DiscrepancyResponse])
+DISCREPANCY_LIST_RESPONSE_ADAPTER = TypeAdapter(DiscrepancyListResponse)
+METRICS_OVERVIEW_ADAPTER = TypeAdapter(MetricsOverview)
+
+
+def json_response(content: Any) -> Response:
+    """Wrap already-serialized JSON (bytes or str) in a Response."""
+    return Response(content=content, media_type="application/json")
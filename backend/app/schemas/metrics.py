@@ -12,7 +12,7 @@ class StatusMetrics(BaseModel):
 
     count: int
     amount: Decimal
-    amount_usd: Optional[Decimal] = None  # Amount in USD
+    amount_usd: Decimal  # Amount in USD (stored at ingest)
 
 
 class MetricsOverview(BaseModel):
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ReconciliationSummary(BaseModel):
@@ -54,8 +54,7 @@ class DiscrepancyResponse(BaseModel):
     details: Optional[Dict[str, Any]] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DiscrepancyListResponse(BaseModel):
@@ -65,6 +64,8 @@ class DiscrepancyListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    is_approx: bool = False  # total is a planner estimate
+    next_cursor: Optional[str] = None  # keyset cursor for the next page
 
 
 class ReconciliationRunRequest(BaseModel):
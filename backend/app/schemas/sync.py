@@ -13,6 +13,7 @@ class SourceSyncStatus(BaseModel):
     status: str  # idle | running | failed
     last_sync_at: Optional[datetime] = None
     last_successful_sync: Optional[datetime] = None
+    last_heartbeat_at: Optional[datetime] = None  # progress is written in batches
     records_synced: int = 0
     total_records: int = 0
     error_message: Optional[str] = None
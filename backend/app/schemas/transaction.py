@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Optional, List, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TransactionBase(BaseModel):
@@ -41,8 +41,7 @@ class TransactionResponse(TransactionBase):
     id: UUID
     ingested_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransactionListResponse(BaseModel):
@@ -53,6 +52,8 @@ class TransactionListResponse(BaseModel):
     page: int
     limit: int
     pages: int
+    is_approx: bool = False  # total is a planner estimate
+    next_cursor: Optional[str] = None  # keyset cursor for the next page
 
 
 class TransactionFilters(BaseModel):
@@ -1,10 +1,13 @@
 """Currency conversion service with live exchange rates."""
 
-import json
+import asyncio
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Union
 
 import httpx
+import orjson
 import structlog
 
 from app.config import settings
@@ -12,6 +15,15 @@ from app.db.redis import cache
 
 logger = structlog.get_logger()
 
+_QUANT_4 = Decimal("0.0001")  # Numeric(18, 4) quantum
+_ZERO_4 = Decimal("0.0000")
+
+
+@lru_cache(maxsize=256)
+def _rate_to_decimal(rate: float) -> Decimal:
+    """Decimal for a float rate; callers reuse a handful of distinct rates."""
+    return Decimal(str(rate))
+
 
 class CurrencyService:
     """
@@ -19,13 +31,16 @@ class CurrencyService:
     
     Features:
     - Fetches rates from exchangerate-api.com
-    - Caches rates in Redis (1 hour TTL)
+    - Caches rates in process (60s) and in Redis (fresh for 1 hour,
+      served stale for up to 24 hours while refreshing in the background)
     - Fallback to static rates on API failure
     - Thread-safe singleton pattern
     """
     
     CACHE_KEY = "exchange_rates:usd"
-    CACHE_TTL = 3600  # 1 hour
+    FRESH_UNTIL_KEY = "exchange_rates:usd:fresh_until"
+    CACHE_TTL = 3600  # 1 hour freshness
+    CACHE_HARD_TTL = 24 * 3600  # stale rates are still served for a day
     
     # Free API (no key required for basic usage)
     API_URL = "https://api.exchangerate-api.com/v4/latest/USD"
@@ -46,9 +61,31 @@ class CurrencyService:
         "CNY": 0.14,      # 1 CNY = 0.14 USD
         "KRW": 0.00075,   # 1 KRW = 0.00075 USD
     }
+    STATIC_RATES_TO_USD_DECIMAL: Dict[str, Decimal] = {
+        c: _rate_to_decimal(r) for c, r in STATIC_RATES_TO_USD.items()
+    }
     
     _instance: Optional["CurrencyService"] = None
     _rates: Optional[Dict[str, float]] = None
+
+    # In-process copy in front of Redis, so conversions are a dict lookup
+    _local_rates: Optional[Dict[str, float]] = None
+    _local_rates_decimal: Dict[str, Decimal] = {}
+    _local_expires: float = 0.0
+    _local_ttl: float = 60.0
+    # Locks are created on first use, inside the running event loop
+    _refresh_lock: Optional[asyncio.Lock] = None
+
+    # Stale-while-revalidate: at most one background refresh at a time
+    _refresh_in_flight: bool = False
+    _refresh_task: Optional[asyncio.Task] = None
+
+    # Single-flight: concurrent API fetches share one in-flight request
+    _inflight: Optional[asyncio.Future] = None
+    _inflight_lock: Optional[asyncio.Lock] = None
+
+    # Long-lived client so refreshes reuse the keep-alive connection
+    _client: Optional[httpx.AsyncClient] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -59,37 +96,147 @@ class CurrencyService:
         """
         Get exchange rates (currency -> USD).
         
-        First tries Redis cache, then API, then static fallback.
+        First tries the in-process copy, then Redis cache, then API,
+        then static fallback.
         
         Returns:
             Dict mapping currency codes to USD rates
         """
+        if self._local_rates and time.monotonic() < self._local_expires:
+            return self._local_rates
+
+        async with self.refresh_lock:
+            # Another caller may have refreshed while we waited
+            if self._local_rates and time.monotonic() < self._local_expires:
+                return self._local_rates
+
+            rates = await self._load_rates()
+            self._set_local_rates(rates)
+            return rates
+
+    def _set_local_rates(self, rates: Dict[str, float]) -> None:
+        """Store rates in the in-process cache."""
+        CurrencyService._local_rates = rates
+        CurrencyService._local_rates_decimal = (
+            self.STATIC_RATES_TO_USD_DECIMAL
+            if rates == self.STATIC_RATES_TO_USD
+            else {c: _rate_to_decimal(r) for c, r in rates.items()}
+        )
+        CurrencyService._local_expires = time.monotonic() + self._local_ttl
+
+    async def _load_rates(self) -> Dict[str, float]:
+        """Load rates from Redis, then API, then static fallback."""
         # Try cache first
         try:
-            cached = await cache.get(self.CACHE_KEY)
+            cached, fresh_until = await cache.get_many(self.CACHE_KEY, self.FRESH_UNTIL_KEY)
             if cached:
-                rates = json.loads(cached)
+                rates = orjson.loads(cached)
+                if not fresh_until or time.time() >= float(fresh_until):
+                    # Serve the stale copy; never block callers on the API
+                    self._schedule_refresh()
                 logger.debug("currency_rates_from_cache", currencies=len(rates))
                 return rates
         except Exception as e:
             logger.warning("currency_cache_read_error", error=str(e))
         
         # Fetch from API
-        rates = await self._fetch_rates_from_api()
+        rates = await self._fetch_shared()
         
         if rates:
-            # Cache the rates
-            try:
-                await cache.set(self.CACHE_KEY, json.dumps(rates), self.CACHE_TTL)
-                logger.info("currency_rates_cached", currencies=len(rates))
-            except Exception as e:
-                logger.warning("currency_cache_write_error", error=str(e))
             return rates
         
         # Fallback to static rates
         logger.warning("currency_using_static_rates")
         return self.STATIC_RATES_TO_USD.copy()
     
+    async def _store_rates(self, rates: Dict[str, float]) -> None:
+        """Write rates and their freshness deadline to Redis."""
+        await cache.set_many(
+            {
+                self.CACHE_KEY: orjson.dumps(rates).decode(),
+                self.FRESH_UNTIL_KEY: str(time.time() + self.CACHE_TTL),
+            },
+            self.CACHE_HARD_TTL,
+        )
+
+    async def _fetch_shared(self) -> Optional[Dict[str, float]]:
+        """
+        Fetch and cache rates, coalescing concurrent callers.
+
+        The first caller starts the fetch; callers arriving while it runs
+        await the same future instead of issuing their own request.
+        """
+        async with self.inflight_lock:
+            if CurrencyService._inflight is None:
+                CurrencyService._inflight = asyncio.ensure_future(self._fetch_and_cache())
+                CurrencyService._inflight.add_done_callback(self._clear_inflight)
+            inflight = CurrencyService._inflight
+        # shield: a cancelled waiter must not cancel the shared fetch
+        return await asyncio.shield(inflight)
+
+    @staticmethod
+    def _clear_inflight(_: asyncio.Future) -> None:
+        CurrencyService._inflight = None
+
+    async def _fetch_and_cache(self) -> Optional[Dict[str, float]]:
+        """Fetch rates from the API and store them locally and in Redis."""
+        rates = await self._fetch_rates_from_api()
+        
+        if rates:
+            self._set_local_rates(rates)
+            try:
+                await self._store_rates(rates)
+                logger.info("currency_rates_cached", currencies=len(rates))
+            except Exception as e:
+                logger.warning("currency_cache_write_error", error=str(e))
+        
+        return rates
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if CurrencyService._refresh_in_flight:
+            return
+        CurrencyService._refresh_in_flight = True
+        CurrencyService._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """Refresh stale rates without blocking callers."""
+        try:
+            await self.refresh_rates()
+        finally:
+            CurrencyService._refresh_in_flight = False
+            CurrencyService._refresh_task = None
+
+    @property
+    def refresh_lock(self) -> asyncio.Lock:
+        if self._refresh_lock is None:
+            CurrencyService._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    @property
+    def inflight_lock(self) -> asyncio.Lock:
+        if self._inflight_lock is None:
+            CurrencyService._inflight_lock = asyncio.Lock()
+        return self._inflight_lock
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            CurrencyService._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=30,
+                ),
+            )
+        return self._client
+
+    async def close(self):
+        """Close HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
     async def _fetch_rates_from_api(self) -> Optional[Dict[str, float]]:
         """
         Fetch rates from exchange rate API.
@@ -101,31 +248,30 @@ class CurrencyService:
             Dict mapping currency codes to USD rates, or None on failure
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(self.API_URL)
-                response.raise_for_status()
-                
-                data = response.json()
-                api_rates = data.get("rates", {})
-                
-                # Invert rates: API gives USD -> X, we need X -> USD
-                # If 1 USD = 83 INR, then 1 INR = 1/83 USD = 0.012 USD
-                rates_to_usd = {}
-                for currency, rate in api_rates.items():
-                    if rate > 0:
-                        rates_to_usd[currency] = round(1.0 / rate, 8)
-                
-                # USD is always 1.0
-                rates_to_usd["USD"] = 1.0
-                
-                logger.info(
-                    "currency_rates_fetched",
-                    currencies=len(rates_to_usd),
-                    sample_inr=rates_to_usd.get("INR"),
-                    sample_eur=rates_to_usd.get("EUR"),
-                )
-                
-                return rates_to_usd
+            response = await self.client.get(self.API_URL)
+            response.raise_for_status()
+            
+            data = response.json()
+            api_rates = data.get("rates", {})
+            
+            # Invert rates: API gives USD -> X, we need X -> USD
+            # If 1 USD = 83 INR, then 1 INR = 1/83 USD = 0.012 USD
+            rates_to_usd = {}
+            for currency, rate in api_rates.items():
+                if rate > 0:
+                    rates_to_usd[currency] = round(1.0 / rate, 8)
+            
+            # USD is always 1.0
+            rates_to_usd["USD"] = 1.0
+            
+            logger.info(
+                "currency_rates_fetched",
+                currencies=len(rates_to_usd),
+                sample_inr=rates_to_usd.get("INR"),
+                sample_eur=rates_to_usd.get("EUR"),
+            )
+            
+            return rates_to_usd
                 
         except httpx.HTTPError as e:
             logger.error("currency_api_http_error", error=str(e))
@@ -134,6 +280,11 @@ class CurrencyService:
         
         return None
     
+    async def _get_rate_decimal(self, currency: str) -> Decimal:
+        """USD rate for a currency as Decimal (0 if unknown)."""
+        await self.get_rates()
+        return self._local_rates_decimal.get(currency, Decimal(0))
+
     async def get_usd_rate(self, currency: str) -> float:
         """
         Get USD rate for a specific currency.
@@ -179,35 +330,39 @@ class CurrencyService:
         Returns:
             Converted amount
         """
-        from_currency = from_currency.upper()
-        to_currency = to_currency.upper()
+        if not amount:
+            return _ZERO_4
+
+        # isupper() avoids allocating a new string for already-upper codes
+        if not from_currency.isupper():
+            from_currency = from_currency.upper()
+        if not to_currency.isupper():
+            to_currency = to_currency.upper()
         
         if from_currency == to_currency:
             return amount
         
-        rates = await self.get_rates()
-        
         # First convert to USD
-        from_rate = rates.get(from_currency, 0.0)
-        if from_rate == 0.0:
+        from_rate = await self._get_rate_decimal(from_currency)
+        if not from_rate:
             logger.warning("currency_conversion_unknown_source", currency=from_currency)
             return Decimal("0")
         
-        amount_usd = amount * Decimal(str(from_rate))
+        amount_usd = amount * from_rate
         
         if to_currency == "USD":
-            return amount_usd.quantize(Decimal("0.0001"))
+            return amount_usd.quantize(_QUANT_4)
         
         # Convert from USD to target currency
-        to_rate = rates.get(to_currency, 0.0)
-        if to_rate == 0.0:
+        to_rate = await self._get_rate_decimal(to_currency)
+        if not to_rate:
             logger.warning("currency_conversion_unknown_target", currency=to_currency)
             return Decimal("0")
         
         # Invert to get USD -> target rate
-        final_amount = amount_usd / Decimal(str(to_rate))
+        final_amount = amount_usd / to_rate
         
-        return final_amount.quantize(Decimal("0.0001"))
+        return final_amount.quantize(_QUANT_4)
     
     async def convert_to_usd(
         self,
@@ -224,13 +379,15 @@ class CurrencyService:
         Returns:
             Amount in USD
         """
+        if not amount:
+            return _ZERO_4
         return await self.convert(amount, currency, "USD")
     
     def convert_sync(
         self,
         amount: Decimal,
         currency: str,
-        rate: Optional[float] = None,
+        rate: Optional[Union[float, Decimal]] = None,
     ) -> Decimal:
         """
         Synchronous conversion using provided or static rate.
@@ -240,24 +397,32 @@ class CurrencyService:
         Args:
             amount: Amount to convert
             currency: Source currency code
-            rate: Optional pre-fetched rate
+            rate: Optional pre-fetched rate (float or Decimal)
             
         Returns:
             Amount in USD
         """
-        currency = currency.upper()
+        if not amount:
+            return _ZERO_4
+
+        if not currency.isupper():
+            currency = currency.upper()
         
         if currency == "USD":
             return amount
         
         if rate is None:
-            rate = self.STATIC_RATES_TO_USD.get(currency, 0.0)
+            rate_decimal = self.STATIC_RATES_TO_USD_DECIMAL.get(currency)
+        elif isinstance(rate, Decimal):
+            rate_decimal = rate
+        else:
+            rate_decimal = _rate_to_decimal(rate)
         
-        if rate == 0.0:
+        if not rate_decimal:
             logger.warning("currency_sync_conversion_unknown", currency=currency)
             return Decimal("0")
         
-        return (amount * Decimal(str(rate))).quantize(Decimal("0.0001"))
+        return (amount * rate_decimal).quantize(_QUANT_4)
     
     async def refresh_rates(self) -> bool:
         """
@@ -266,15 +431,11 @@ class CurrencyService:
         Returns:
             True if rates were successfully refreshed
         """
-        rates = await self._fetch_rates_from_api()
+        rates = await self._fetch_shared()
         
         if rates:
-            try:
-                await cache.set(self.CACHE_KEY, json.dumps(rates), self.CACHE_TTL)
-                logger.info("currency_rates_refreshed", currencies=len(rates))
-                return True
-            except Exception as e:
-                logger.error("currency_refresh_cache_error", error=str(e))
+            logger.info("currency_rates_refreshed", currencies=len(rates))
+            return True
         
         return False
 
@@ -1,12 +1,13 @@
 """Reconciliation service for matching transactions between sources."""
 
 import uuid
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Any
 
 import structlog
-from sqlalchemy import select, and_
+from sqlalchemy import Select, select, and_, or_, case, cast, func, insert, update, BigInteger
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import async_session_maker
@@ -27,16 +28,25 @@ class ReconciliationService:
     AMOUNT_TOLERANCE = Decimal("0.01")  # 1 paisa
     AMOUNT_TOLERANCE_PERCENT = Decimal("0.001")  # 0.1%
 
+    # Amounts are compared as integers in units of 1/10_000 (Numeric(18, 4))
+    AMOUNT_SCALE = 10_000
+    AMOUNT_TOLERANCE_SCALED = int(AMOUNT_TOLERANCE * AMOUNT_SCALE)
+    AMOUNT_TOLERANCE_DIVISOR = int(1 / AMOUNT_TOLERANCE_PERCENT)
+
+    # Rows per multi-row INSERT when saving results
+    INSERT_CHUNK_SIZE = 5000
+    # Joined rows fetched per round-trip from the server-side cursor
+    STREAM_BATCH_SIZE = 10_000
+
     async def run_for_date(self, recon_date: date) -> Dict[str, Any]:
         """
         Run reconciliation for a specific date.
         
         Algorithm:
-        1. Load Vima transactions for date
-        2. Load PayShack transactions for date
-        3. Build index by client_operation_id / order_id
-        4. Match and compare
-        5. Save results
+        1. FULL OUTER JOIN the day's Vima and PayShack transactions in SQL
+           on client_operation_id = coalesce(order_id, client_operation_id)
+        2. Stream the joined rows and compare matched pairs
+        3. Save results in chunks as they are produced
         """
         async with async_session_maker() as session:
             # Create reconciliation run
@@ -47,100 +57,85 @@ class ReconciliationService:
             session.add(run)
             await session.commit()
             await session.refresh(run)
+            run_id = run.id
 
             try:
                 logger.info("reconciliation_started", date=recon_date.isoformat())
 
-                # Load Vima transactions
-                vima_txns = await self._load_transactions(
-                    session,
-                    source="vima",
-                    date=recon_date,
-                )
-                
-                # Load PayShack transactions
-                payshack_txns = await self._load_transactions(
-                    session,
-                    source="payshack",
-                    date=recon_date,
+                # One buffer per match_status: each branch sets its own fixed
+                # key set, and executemany needs the same keys for every row
+                pending: Dict[str, List[Dict[str, Any]]] = {
+                    status: []
+                    for status in ("matched", "discrepancy", "missing_vima", "missing_payshack")
+                }
+                # Run summary, counted as results are produced
+                counts = dict.fromkeys(pending, 0)
+                # Rows arrive in batches from a server-side cursor, so memory
+                # is bounded by the batch and insert chunk sizes
+                stream = await session.stream(
+                    self._match_query(recon_date).execution_options(
+                        yield_per=self.STREAM_BATCH_SIZE
+                    )
                 )
+                async for row in stream:
+                    if row.match_status in ("matched", "discrepancy"):
+                        # Found match - compared in SQL
+                        result = self._compare_transactions(run.id, recon_date, row)
+                    elif row.match_status == "missing_payshack":
+                        if not row.client_operation_id:
+                            # No matching key - cannot reconcile
+                            continue
+                        result = {
+                            "recon_run_id": run.id,
+                            "recon_date": recon_date,
+                            "vima_txn_id": row.vima_id,
+                            "client_operation_id": row.client_operation_id,
+                            "match_status": "missing_payshack",
+                            "discrepancy_type": "missing",
+                            "vima_amount": row.vima_amount,
+                            "vima_status": row.vima_status,
+                        }
+                    else:
+                        # PayShack transaction not in Vima
+                        result = {
+                            "recon_run_id": run.id,
+                            "recon_date": recon_date,
+                            "payshack_txn_id": row.payshack_id,
+                            "client_operation_id": row.match_key,
+                            "match_status": "missing_vima",
+                            "discrepancy_type": "missing",
+                            "payshack_amount": row.payshack_amount,
+                            "payshack_status": row.payshack_status,
+                        }
+
+                    counts[result["match_status"]] += 1
+                    results = pending[result["match_status"]]
+                    results.append(result)
+                    if len(results) >= self.INSERT_CHUNK_SIZE:
+                        await self._save_results(session, results)
+                        results.clear()
+
+                for results in pending.values():
+                    await self._save_results(session, results)
+
+                # Counted per source: duplicate keys repeat rows in the join
+                source_counts = await self._count_sources(session, recon_date)
+                total_vima = source_counts["vima"]
+                total_payshack = source_counts["payshack"]
 
                 logger.info(
                     "reconciliation_data_loaded",
-                    vima_count=len(vima_txns),
-                    payshack_count=len(payshack_txns),
+                    vima_count=total_vima,
+                    payshack_count=total_payshack,
                 )
 
-                # Build PayShack index by order_id
-                payshack_index: Dict[str, Transaction] = {}
-                for txn in payshack_txns:
-                    if txn.order_id:
-                        payshack_index[txn.order_id] = txn
-                    elif txn.client_operation_id:
-                        payshack_index[txn.client_operation_id] = txn
-
-                # Process matching
-                results = []
-                matched_payshack_ids = set()
-
-                for vima_txn in vima_txns:
-                    matching_key = vima_txn.client_operation_id
-                    
-                    if not matching_key:
-                        # No matching key - cannot reconcile
-                        continue
-
-                    payshack_txn = payshack_index.get(matching_key)
-
-                    if payshack_txn:
-                        # Found match - compare
-                        matched_payshack_ids.add(payshack_txn.id)
-                        result = self._compare_transactions(
-                            run.id, recon_date, vima_txn, payshack_txn
-                        )
-                    else:
-                        # Missing in PayShack
-                        result = ReconciliationResult(
-                            recon_run_id=run.id,
-                            recon_date=recon_date,
-                            vima_txn_id=vima_txn.id,
-                            payshack_txn_id=None,
-                            client_operation_id=matching_key,
-                            match_status="missing_payshack",
-                            discrepancy_type="missing",
-                            vima_amount=vima_txn.amount,
-                            vima_status=vima_txn.status,
-                        )
-
-                    results.append(result)
+                matched_count = counts["matched"]
+                discrepancy_count = counts["discrepancy"]
+                missing_vima = counts["missing_vima"]
+                missing_payshack = counts["missing_payshack"]
 
-                # Find PayShack transactions not in Vima
-                for payshack_txn in payshack_txns:
-                    if payshack_txn.id not in matched_payshack_ids:
-                        result = ReconciliationResult(
-                            recon_run_id=run.id,
-                            recon_date=recon_date,
-                            vima_txn_id=None,
-                            payshack_txn_id=payshack_txn.id,
-                            client_operation_id=payshack_txn.order_id or payshack_txn.client_operation_id,
-                            match_status="missing_vima",
-                            discrepancy_type="missing",
-                            payshack_amount=payshack_txn.amount,
-                            payshack_status=payshack_txn.status,
-                        )
-                        results.append(result)
-
-                # Save results
-                session.add_all(results)
-
-                # Update run summary
-                matched_count = sum(1 for r in results if r.match_status == "matched")
-                discrepancy_count = sum(1 for r in results if r.match_status == "discrepancy")
-                missing_vima = sum(1 for r in results if r.match_status == "missing_vima")
-                missing_payshack = sum(1 for r in results if r.match_status == "missing_payshack")
-
-                run.total_vima = len(vima_txns)
-                run.total_payshack = len(payshack_txns)
+                run.total_vima = total_vima
+                run.total_payshack = total_payshack
                 run.matched = matched_count
                 run.discrepancies = discrepancy_count
                 run.missing_vima = missing_vima
@@ -171,8 +166,14 @@ class ReconciliationService:
             except Exception as e:
                 logger.error("reconciliation_failed", error=str(e))
                 
-                run.status = "failed"
-                run.error_message = str(e)[:500]
+                # Discard result chunks already flushed for this run; only
+                # the failed status is committed
+                await session.rollback()
+                await session.execute(
+                    update(ReconciliationRun)
+                    .where(ReconciliationRun.id == run_id)
+                    .values(status="failed", error_message=str(e)[:500])
+                )
                 await session.commit()
 
                 return {
@@ -180,82 +181,146 @@ class ReconciliationService:
                     "error": str(e),
                 }
 
-    async def _load_transactions(
+    async def _save_results(
         self,
         session: AsyncSession,
-        source: str,
-        date: date,
-    ) -> List[Transaction]:
-        """Load transactions for a source and date."""
-        from datetime import datetime as dt
-
-        start = dt.combine(date, dt.min.time())
-        end = dt.combine(date, dt.max.time())
+        results: List[Dict[str, Any]],
+    ) -> None:
+        """Insert a chunk of result dicts with one multi-row INSERT."""
+        if results:
+            await session.execute(insert(ReconciliationResult), results)
 
+    async def _count_sources(
+        self,
+        session: AsyncSession,
+        recon_date: date,
+    ) -> Dict[str, int]:
+        """Count the day's transactions per source."""
+        start, end = self._day_bounds(recon_date)
         result = await session.execute(
-            select(Transaction).where(
+            select(Transaction.source, func.count())
+            .where(
+                Transaction.source.in_(("vima", "payshack")),
+                Transaction.created_at >= start,
+                Transaction.created_at < end,
+            )
+            .group_by(Transaction.source)
+        )
+        counts = dict.fromkeys(("vima", "payshack"), 0)
+        counts.update(result.all())
+        return counts
+
+    @staticmethod
+    def _day_bounds(day: date):
+        """Half-open UTC day: [start, start + 1 day)."""
+        start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+        return start, start + timedelta(days=1)
+
+    def _source_rows(self, source: str, date: date, key):
+        """
+        Columns reconciliation needs for one source and date, as a CTE.
+
+        amount_scaled is the amount as an integer number of 1/10_000 units,
+        computed by Postgres, so comparisons avoid Decimal arithmetic.
+        """
+        start, end = self._day_bounds(date)
+
+        return (
+            select(
+                Transaction.id,
+                Transaction.amount,
+                cast(Transaction.amount * self.AMOUNT_SCALE, BigInteger).label("amount_scaled"),
+                Transaction.status,
+                key.label("match_key"),
+            )
+            .where(
                 and_(
                     Transaction.source == source,
                     Transaction.created_at >= start,
-                    Transaction.created_at <= end,
+                    Transaction.created_at < end,
                 )
             )
+            .cte(source)
+        )
+
+    def _match_query(self, recon_date: date) -> Select:
+        """
+        FULL OUTER JOIN of the day's Vima and PayShack transactions.
+
+        Matched pairs are compared in the same query: amount_mismatch uses
+        scaled integers with tolerance max(AMOUNT_TOLERANCE,
+        amount * AMOUNT_TOLERANCE_PERCENT), so Python only builds rows.
+        """
+        vima = self._source_rows("vima", recon_date, Transaction.client_operation_id)
+        payshack = self._source_rows(
+            "payshack",
+            recon_date,
+            func.coalesce(Transaction.order_id, Transaction.client_operation_id),
+        )
+
+        amount_mismatch = func.abs(
+            vima.c.amount_scaled - payshack.c.amount_scaled
+        ) > func.greatest(
+            self.AMOUNT_TOLERANCE_SCALED,
+            vima.c.amount_scaled // self.AMOUNT_TOLERANCE_DIVISOR,
+        )
+        status_mismatch = vima.c.status != payshack.c.status
+
+        return select(
+            vima.c.id.label("vima_id"),
+            vima.c.amount.label("vima_amount"),
+            vima.c.status.label("vima_status"),
+            vima.c.match_key.label("client_operation_id"),
+            payshack.c.id.label("payshack_id"),
+            payshack.c.amount.label("payshack_amount"),
+            payshack.c.status.label("payshack_status"),
+            payshack.c.match_key.label("match_key"),
+            amount_mismatch.label("amount_mismatch"),
+            status_mismatch.label("status_mismatch"),
+            func.abs(vima.c.amount - payshack.c.amount).label("amount_diff"),
+            case(
+                (vima.c.id.is_(None), "missing_vima"),
+                (payshack.c.id.is_(None), "missing_payshack"),
+                (or_(amount_mismatch, status_mismatch), "discrepancy"),
+                else_="matched",
+            ).label("match_status"),
+        ).select_from(
+            vima.join(payshack, vima.c.match_key == payshack.c.match_key, full=True)
         )
-        return list(result.scalars().all())
 
     def _compare_transactions(
         self,
         run_id: uuid.UUID,
         recon_date: date,
-        vima: Transaction,
-        payshack: Transaction,
-    ) -> ReconciliationResult:
-        """Compare two matched transactions and return result."""
+        row: Row,
+    ) -> Dict[str, Any]:
+        """Build the result for a matched pair from the SQL comparison flags."""
         discrepancies = []
-        
-        # Compare amount
-        amount_diff = abs(vima.amount - payshack.amount)
-        tolerance = max(
-            self.AMOUNT_TOLERANCE,
-            vima.amount * self.AMOUNT_TOLERANCE_PERCENT,
-        )
-        
-        if amount_diff > tolerance:
+        if row.amount_mismatch:
             discrepancies.append("amount")
-
-        # Compare status
-        if vima.status != payshack.status:
+        if row.status_mismatch:
             discrepancies.append("status")
 
+        result = {
+            "recon_run_id": run_id,
+            "recon_date": recon_date,
+            "vima_txn_id": row.vima_id,
+            "payshack_txn_id": row.payshack_id,
+            "client_operation_id": row.client_operation_id,
+            "match_status": "matched",
+            "vima_amount": row.vima_amount,
+            "payshack_amount": row.payshack_amount,
+            "vima_status": row.vima_status,
+            "payshack_status": row.payshack_status,
+        }
+
         if discrepancies:
-            return ReconciliationResult(
-                recon_run_id=run_id,
-                recon_date=recon_date,
-                vima_txn_id=vima.id,
-                payshack_txn_id=payshack.id,
-                client_operation_id=vima.client_operation_id,
-                match_status="discrepancy",
-                discrepancy_type=discrepancies[0],  # Primary discrepancy
-                vima_amount=vima.amount,
-                payshack_amount=payshack.amount,
-                amount_diff=amount_diff if "amount" in discrepancies else None,
-                vima_status=vima.status,
-                payshack_status=payshack.status,
-                details={"discrepancies": discrepancies},
-            )
-        else:
-            return ReconciliationResult(
-                recon_run_id=run_id,
-                recon_date=recon_date,
-                vima_txn_id=vima.id,
-                payshack_txn_id=payshack.id,
-                client_operation_id=vima.client_operation_id,
-                match_status="matched",
-                vima_amount=vima.amount,
-                payshack_amount=payshack.amount,
-                vima_status=vima.status,
-                payshack_status=payshack.status,
-            )
+            result["match_status"] = "discrepancy"
+            result["discrepancy_type"] = discrepancies[0]  # Primary discrepancy
+            result["amount_diff"] = row.amount_diff if "amount" in discrepancies else None
+            result["details"] = {"discrepancies": discrepancies}
+
+        return result
 
 
 # Helper function for API routes
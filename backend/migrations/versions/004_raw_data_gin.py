@@ -0,0 +1,39 @@
+"""GIN indexes on raw_data for JSONB containment filters.
+
+Revision ID: 004_raw_data_gin
+Revises: 003_add_amount_usd
+Create Date: 2026-01-20
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004_raw_data_gin'
+down_revision = '003_add_amount_usd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index raw_data with jsonb_path_ops (serves @> only, smaller than default GIN)."""
+    op.create_index(
+        'ix_txn_raw_gin',
+        'transactions',
+        ['raw_data'],
+        postgresql_using='gin',
+        postgresql_ops={'raw_data': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'ix_payshack_clients_raw_gin',
+        'payshack_clients',
+        ['raw_data'],
+        postgresql_using='gin',
+        postgresql_ops={'raw_data': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop raw_data GIN indexes."""
+    op.drop_index('ix_payshack_clients_raw_gin', table_name='payshack_clients')
+    op.drop_index('ix_txn_raw_gin', table_name='transactions')
@@ -0,0 +1,177 @@
+"""Partition transactions by month and reconciliation_results by day.
+
+The existing tables become the DEFAULT partitions of new range-partitioned
+parents. Primary keys and unique indexes are widened with the partition key,
+as PostgreSQL requires. Future partitions are created by app.db.partitions.
+
+Revision ID: 005_partition_tables
+Revises: 004_raw_data_gin
+Create Date: 2026-01-21
+
+"""
+from datetime import date, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_partition_tables'
+down_revision = '004_raw_data_gin'
+branch_labels = None
+depends_on = None
+
+
+TXN_INDEXES = [
+    'idx_txn_source',
+    'idx_txn_source_date',
+    'idx_txn_project',
+    'idx_txn_status',
+    'idx_txn_client_op_id',
+    'idx_txn_order_id',
+    'idx_txn_reference_id',
+    'idx_txn_data_hash',
+    'idx_txn_created_at',
+    'ix_transactions_amount_usd',
+    'ix_txn_raw_gin',
+]
+
+RECON_INDEXES = [
+    'idx_recon_results_date_status',
+    'idx_recon_results_run',
+    'idx_recon_results_client_op',
+]
+
+
+def _create_txn_indexes() -> None:
+    op.create_index('idx_txn_source', 'transactions', ['source'])
+    op.create_index('idx_txn_source_date', 'transactions', ['source', 'created_at'])
+    op.create_index('idx_txn_project', 'transactions', ['project'])
+    op.create_index('idx_txn_status', 'transactions', ['status'])
+    op.create_index('idx_txn_client_op_id', 'transactions', ['client_operation_id'])
+    op.create_index('idx_txn_order_id', 'transactions', ['order_id'])
+    op.create_index('idx_txn_reference_id', 'transactions', ['reference_id'])
+    op.create_index('idx_txn_created_at', 'transactions', [sa.text('created_at DESC')])
+    op.create_index('ix_transactions_amount_usd', 'transactions', ['amount_usd'])
+    op.create_index(
+        'ix_txn_raw_gin',
+        'transactions',
+        ['raw_data'],
+        postgresql_using='gin',
+        postgresql_ops={'raw_data': 'jsonb_path_ops'},
+    )
+
+
+def _create_recon_indexes() -> None:
+    op.create_index('idx_recon_results_date_status', 'reconciliation_results', ['recon_date', 'match_status'])
+    op.create_index('idx_recon_results_run', 'reconciliation_results', ['recon_run_id'])
+    op.create_index('idx_recon_results_client_op', 'reconciliation_results', ['client_operation_id'])
+
+
+def _add_months(d: date, months: int) -> date:
+    month = d.month - 1 + months
+    return date(d.year + month // 12, month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Convert transactions and reconciliation_results to partitioned tables."""
+    # --- transactions: monthly by created_at ---
+    op.execute("ALTER TABLE transactions RENAME TO transactions_default")
+    op.execute("ALTER TABLE transactions_default DROP CONSTRAINT transactions_pkey")
+    for name in TXN_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute(
+        "CREATE TABLE transactions "
+        "(LIKE transactions_default INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id, created_at)")
+    op.create_index('idx_txn_data_hash', 'transactions', ['data_hash', 'created_at'], unique=True)
+    _create_txn_indexes()
+
+    # Existing rows stay where they are; indexes are built on attach
+    op.execute("ALTER TABLE transactions ATTACH PARTITION transactions_default DEFAULT")
+
+    # Months after the current one; the current month stays in DEFAULT
+    first = date.today().replace(day=1)
+    for i in range(1, 4):
+        start = _add_months(first, i)
+        end = _add_months(first, i + 1)
+        op.execute(
+            f"CREATE TABLE transactions_y{start.year}m{start.month:02d} "
+            f"PARTITION OF transactions "
+            f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        )
+
+    # --- reconciliation_results: daily by recon_date ---
+    op.execute("ALTER TABLE reconciliation_results RENAME TO reconciliation_results_default")
+    op.execute("ALTER TABLE reconciliation_results_default DROP CONSTRAINT reconciliation_results_pkey")
+    op.execute(
+        "ALTER TABLE reconciliation_results_default "
+        "DROP CONSTRAINT reconciliation_results_recon_run_id_fkey"
+    )
+    for name in RECON_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute(
+        "CREATE TABLE reconciliation_results "
+        "(LIKE reconciliation_results_default INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (recon_date)"
+    )
+    op.execute(
+        "ALTER TABLE reconciliation_results "
+        "ADD CONSTRAINT reconciliation_results_pkey PRIMARY KEY (id, recon_date)"
+    )
+    op.create_foreign_key(
+        'reconciliation_results_recon_run_id_fkey',
+        'reconciliation_results',
+        'reconciliation_runs',
+        ['recon_run_id'],
+        ['id'],
+    )
+    _create_recon_indexes()
+
+    op.execute("ALTER TABLE reconciliation_results ATTACH PARTITION reconciliation_results_default DEFAULT")
+
+    tomorrow = date.today() + timedelta(days=1)
+    for i in range(7):
+        day = tomorrow + timedelta(days=i)
+        op.execute(
+            f"CREATE TABLE reconciliation_results_d{day.strftime('%Y%m%d')} "
+            f"PARTITION OF reconciliation_results "
+            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+        )
+
+
+def downgrade() -> None:
+    """Fold partitions back into plain tables."""
+    # --- reconciliation_results ---
+    op.execute(
+        "CREATE TABLE reconciliation_results_plain "
+        "(LIKE reconciliation_results INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute("INSERT INTO reconciliation_results_plain SELECT * FROM reconciliation_results")
+    op.execute("DROP TABLE reconciliation_results CASCADE")
+    op.execute("ALTER TABLE reconciliation_results_plain RENAME TO reconciliation_results")
+    op.execute("ALTER TABLE reconciliation_results ADD CONSTRAINT reconciliation_results_pkey PRIMARY KEY (id)")
+    op.create_foreign_key(
+        'reconciliation_results_recon_run_id_fkey',
+        'reconciliation_results',
+        'reconciliation_runs',
+        ['recon_run_id'],
+        ['id'],
+    )
+    _create_recon_indexes()
+
+    # --- transactions ---
+    op.execute(
+        "CREATE TABLE transactions_plain "
+        "(LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute("INSERT INTO transactions_plain SELECT * FROM transactions")
+    op.execute("DROP TABLE transactions CASCADE")
+    op.execute("ALTER TABLE transactions_plain RENAME TO transactions")
+    op.execute("ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id)")
+    op.create_index('idx_txn_data_hash', 'transactions', ['data_hash'], unique=True)
+    _create_txn_indexes()
@@ -0,0 +1,47 @@
+"""Use (source, source_id) as the transactions upsert key.
+
+Replaces the unique data_hash index with a unique constraint on the natural
+key. created_at is included because unique constraints on a partitioned
+table must contain the partition key.
+
+Revision ID: 006_txn_natural_key
+Revises: 005_partition_tables
+Create Date: 2026-01-22
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006_txn_natural_key'
+down_revision = '005_partition_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the data_hash unique index for a natural-key unique constraint."""
+    # Rows differing only in amount/currency had distinct hashes; keep the latest
+    op.execute(
+        """
+        DELETE FROM transactions t
+        USING transactions d
+        WHERE t.source = d.source
+          AND t.source_id = d.source_id
+          AND t.created_at = d.created_at
+          AND (t.ingested_at, t.id) < (d.ingested_at, d.id)
+        """
+    )
+    op.drop_index('idx_txn_data_hash', table_name='transactions')
+    op.execute("DROP INDEX IF EXISTS idx_txn_source_source_id")
+    op.create_unique_constraint(
+        'uq_txn_source_source_id',
+        'transactions',
+        ['source', 'source_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    """Restore the unique data_hash index."""
+    op.drop_constraint('uq_txn_source_source_id', 'transactions', type_='unique')
+    op.create_index('idx_txn_data_hash', 'transactions', ['data_hash', 'created_at'], unique=True)
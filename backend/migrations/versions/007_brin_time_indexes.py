@@ -0,0 +1,42 @@
+"""Replace the created_at btree with BRIN; add BRIN on recon_date.
+
+Revision ID: 007_brin_time_indexes
+Revises: 006_txn_natural_key
+Create Date: 2026-01-22
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_brin_time_indexes'
+down_revision = '006_txn_natural_key'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap dense time btrees for BRIN summaries."""
+    op.drop_index('idx_txn_created_at', table_name='transactions')
+    op.create_index(
+        'idx_txn_created_brin',
+        'transactions',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32, 'autosummarize': 'on'},
+    )
+    op.create_index(
+        'idx_recon_results_date_brin',
+        'reconciliation_results',
+        ['recon_date'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32, 'autosummarize': 'on'},
+    )
+
+
+def downgrade() -> None:
+    """Restore the created_at DESC btree."""
+    op.drop_index('idx_recon_results_date_brin', table_name='reconciliation_results')
+    op.drop_index('idx_txn_created_brin', table_name='transactions')
+    op.create_index('idx_txn_created_at', 'transactions', [sa.text('created_at DESC')])
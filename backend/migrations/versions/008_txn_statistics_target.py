@@ -0,0 +1,31 @@
+"""Raise statistics targets on low-cardinality transaction columns.
+
+Revision ID: 008_txn_statistics_target
+Revises: 007_brin_time_indexes
+Create Date: 2026-01-23
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008_txn_statistics_target'
+down_revision = '007_brin_time_indexes'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = ('status', 'source', 'project')
+
+
+def upgrade() -> None:
+    """Collect larger samples for columns used in status/project breakdowns."""
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE transactions ALTER COLUMN {column} SET STATISTICS 1000")
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Reset statistics targets to the server default."""
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE transactions ALTER COLUMN {column} SET STATISTICS -1")
@@ -0,0 +1,102 @@
+"""Make transactions.amount_usd the stored source of truth.
+
+Backfills missing USD amounts with the static rates one day of created_at
+at a time, sets NOT NULL and adds a (status, created_at) index covering
+amount_usd for status sums.
+
+Revision ID: 009_amount_usd_not_null
+Revises: 008_txn_statistics_target
+Create Date: 2026-01-23
+
+"""
+from datetime import timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_amount_usd_not_null'
+down_revision = '008_txn_statistics_target'
+branch_labels = None
+depends_on = None
+
+# USD rates frozen at the time of this revision (the static fallback table
+# then in CurrencyService), so the backfill never depends on app code
+USD_RATES = {
+    'USD': '1.0',
+    'INR': '0.012',
+    'EUR': '1.08',
+    'GBP': '1.27',
+    'RUB': '0.011',
+    'AED': '0.27',
+    'BRL': '0.20',
+    'CAD': '0.74',
+    'AUD': '0.65',
+    'JPY': '0.0067',
+    'CNY': '0.14',
+    'KRW': '0.00075',
+}
+
+# Each window is updated and committed on its own, so row locks and WAL
+# are released between batches instead of held for the whole table
+BACKFILL_WINDOW = timedelta(days=1)
+
+
+def _backfill_amount_usd() -> None:
+    rates = ", ".join(
+        f"('{currency}', {rate}::numeric)" for currency, rate in USD_RATES.items()
+    )
+    convert = sa.text(
+        f"""
+        UPDATE transactions t
+        SET amount_usd = ROUND(t.amount * COALESCE(t.exchange_rate, r.rate), 4),
+            exchange_rate = COALESCE(t.exchange_rate, r.rate)
+        FROM (VALUES {rates}) AS r(currency, rate)
+        WHERE t.amount_usd IS NULL
+          AND r.currency = t.currency
+          AND t.created_at >= :start AND t.created_at < :end
+        """
+    )
+    # Unknown currencies convert to 0, as in CurrencyService.convert_sync
+    zero = sa.text(
+        "UPDATE transactions SET amount_usd = 0 "
+        "WHERE amount_usd IS NULL "
+        "AND created_at >= :start AND created_at < :end"
+    )
+
+    conn = op.get_bind()
+    start, last = conn.execute(
+        sa.text(
+            "SELECT min(created_at), max(created_at) "
+            "FROM transactions WHERE amount_usd IS NULL"
+        )
+    ).one()
+    if start is None:
+        return
+
+    with op.get_context().autocommit_block():
+        while start <= last:
+            window = {"start": start, "end": start + BACKFILL_WINDOW}
+            conn.execute(convert, window)
+            conn.execute(zero, window)
+            start = window["end"]
+
+
+def upgrade() -> None:
+    """Backfill amount_usd, enforce NOT NULL and add the covering index."""
+    _backfill_amount_usd()
+
+    op.alter_column('transactions', 'amount_usd', nullable=False)
+    op.create_index(
+        'idx_txn_status_amount_usd',
+        'transactions',
+        ['status', 'created_at'],
+        postgresql_include=['amount_usd'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the covering index and allow NULL again."""
+    op.drop_index('idx_txn_status_amount_usd', table_name='transactions')
+    op.alter_column('transactions', 'amount_usd', nullable=True)
@@ -0,0 +1,30 @@
+"""Composite (created_at DESC, id DESC) index for keyset pagination.
+
+Revision ID: 010_txn_keyset_index
+Revises: 009_amount_usd_not_null
+Create Date: 2026-01-24
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_txn_keyset_index'
+down_revision = '009_amount_usd_not_null'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the transactions list sort key."""
+    op.create_index(
+        'idx_txn_created_id',
+        'transactions',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset index."""
+    op.drop_index('idx_txn_created_id', table_name='transactions')
@@ -0,0 +1,29 @@
+"""Add sync_state.last_heartbeat_at for batched progress writes.
+
+Revision ID: 011_sync_heartbeat
+Revises: 010_txn_keyset_index
+Create Date: 2026-01-24
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_sync_heartbeat'
+down_revision = '010_txn_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the heartbeat column."""
+    op.add_column(
+        'sync_state',
+        sa.Column('last_heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the heartbeat column."""
+    op.drop_column('sync_state', 'last_heartbeat_at')
@@ -0,0 +1,37 @@
+"""Server-side NOW() defaults for PayShack metadata timestamps.
+
+Revision ID: 012_metadata_server_defaults
+Revises: 011_sync_heartbeat
+Create Date: 2026-01-25
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_metadata_server_defaults'
+down_revision = '011_sync_heartbeat'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = {
+    'payshack_clients': ('created_at', 'updated_at', 'synced_at'),
+    'payshack_resellers': ('created_at', 'updated_at', 'synced_at'),
+    'payshack_service_providers': ('created_at', 'updated_at', 'synced_at'),
+    'payshack_balance_snapshots': ('snapshot_at',),
+}
+
+
+def upgrade() -> None:
+    """Set DEFAULT now() on metadata timestamp columns."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Drop the server defaults."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
@@ -0,0 +1,56 @@
+"""Native ENUM types for source, status and match_status.
+
+Revision ID: 013_enum_columns
+Revises: 012_metadata_server_defaults
+Create Date: 2026-01-25
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013_enum_columns'
+down_revision = '012_metadata_server_defaults'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type, values, previous VARCHAR length)
+ENUM_COLUMNS = (
+    ('transactions', 'source', 'txn_source', ('vima', 'payshack'), 20),
+    (
+        'transactions',
+        'status',
+        'txn_status',
+        ('success', 'failed', 'pending', 'processing', 'refunded'),
+        30,
+    ),
+    (
+        'reconciliation_results',
+        'match_status',
+        'match_status',
+        ('matched', 'discrepancy', 'missing_vima', 'missing_payshack'),
+        30,
+    ),
+)
+
+
+def upgrade() -> None:
+    """Create the enum types and convert the columns (rewrites the tables)."""
+    for table, column, type_name, values, _ in ENUM_COLUMNS:
+        labels = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({labels})")
+        # Indexes and constraints on the column are rebuilt by ALTER TYPE
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::text::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    """Convert the columns back to VARCHAR and drop the enum types."""
+    for table, column, type_name, _, length in reversed(ENUM_COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR({length}) USING {column}::text"
+        )
+        op.execute(f"DROP TYPE {type_name}")
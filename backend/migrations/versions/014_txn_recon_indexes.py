@@ -0,0 +1,40 @@
+"""Partial covering indexes for reconciliation scans.
+
+Revision ID: 014_txn_recon_indexes
+Revises: 013_enum_columns
+Create Date: 2026-01-26
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_txn_recon_indexes'
+down_revision = '013_enum_columns'
+branch_labels = None
+depends_on = None
+
+RECON_INCLUDE = ['amount', 'status', 'order_id', 'id']
+
+
+def upgrade() -> None:
+    """Add per-source covering indexes; drop the single-column source index."""
+    for source in ('vima', 'payshack'):
+        op.create_index(
+            f'idx_txn_recon_{source}',
+            'transactions',
+            ['created_at', 'client_operation_id'],
+            postgresql_include=RECON_INCLUDE,
+            postgresql_where=sa.text(f"source = '{source}'"),
+        )
+
+    # source alone is too unselective to be useful; idx_txn_source_date stays
+    op.drop_index('idx_txn_source', table_name='transactions')
+
+
+def downgrade() -> None:
+    """Restore idx_txn_source and drop the reconciliation indexes."""
+    op.create_index('idx_txn_source', 'transactions', ['source'])
+    for source in ('vima', 'payshack'):
+        op.drop_index(f'idx_txn_recon_{source}', table_name='transactions')
@@ -0,0 +1,33 @@
+"""Composite (recon_run_id, match_status) index for run summaries.
+
+Revision ID: 015_recon_run_status_index
+Revises: 014_txn_recon_indexes
+Create Date: 2026-01-26
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015_recon_run_status_index'
+down_revision = '014_txn_recon_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace idx_recon_results_run with a (run, status) covering index."""
+    op.create_index(
+        'idx_recon_results_run_status',
+        'reconciliation_results',
+        ['recon_run_id', 'match_status'],
+        postgresql_include=['id'],
+    )
+    # Leading column of the new index covers run lookups
+    op.drop_index('idx_recon_results_run', table_name='reconciliation_results')
+
+
+def downgrade() -> None:
+    """Restore idx_recon_results_run."""
+    op.create_index('idx_recon_results_run', 'reconciliation_results', ['recon_run_id'])
+    op.drop_index('idx_recon_results_run_status', table_name='reconciliation_results')
@@ -0,0 +1,48 @@
+"""Covering ix_balance_snapshots_entity, built concurrently.
+
+Revision ID: 016_snapshot_entity_include
+Revises: 015_recon_run_status_index
+Create Date: 2026-01-27
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '016_snapshot_entity_include'
+down_revision = '015_recon_run_status_index'
+branch_labels = None
+depends_on = None
+
+
+def _swap_entity_index(include) -> None:
+    """Build the replacement next to the old index, then swap names."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_balance_snapshots_entity_new',
+            'payshack_balance_snapshots',
+            ['entity_type', 'entity_id'],
+            postgresql_include=include,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_balance_snapshots_entity',
+            table_name='payshack_balance_snapshots',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute(
+        "ALTER INDEX ix_balance_snapshots_entity_new "
+        "RENAME TO ix_balance_snapshots_entity"
+    )
+
+
+def upgrade() -> None:
+    """Add INCLUDE (snapshot_at, balance) to ix_balance_snapshots_entity."""
+    _swap_entity_index(['snapshot_at', 'balance'])
+
+
+def downgrade() -> None:
+    """Restore the plain (entity_type, entity_id) index."""
+    _swap_entity_index([])
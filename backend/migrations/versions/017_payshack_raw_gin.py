@@ -0,0 +1,48 @@
+"""GIN jsonb_path_ops indexes on remaining PayShack raw_data columns.
+
+Revision ID: 017_payshack_raw_gin
+Revises: 016_snapshot_entity_include
+Create Date: 2026-01-27
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '017_payshack_raw_gin'
+down_revision = '016_snapshot_entity_include'
+branch_labels = None
+depends_on = None
+
+# payshack_clients is covered by 004; balance snapshots carry no raw_data
+RAW_GIN_INDEXES = (
+    ('ix_payshack_resellers_raw_gin', 'payshack_resellers'),
+    ('ix_payshack_service_providers_raw_gin', 'payshack_service_providers'),
+)
+
+
+def upgrade() -> None:
+    """Index raw_data with jsonb_path_ops (serves @> only, smaller than default GIN)."""
+    with op.get_context().autocommit_block():
+        for name, table in RAW_GIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ['raw_data'],
+                postgresql_using='gin',
+                postgresql_ops={'raw_data': 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop raw_data GIN indexes."""
+    with op.get_context().autocommit_block():
+        for name, table in reversed(RAW_GIN_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
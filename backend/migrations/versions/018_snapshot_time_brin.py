@@ -0,0 +1,53 @@
+"""Replace the snapshot_at btree with BRIN.
+
+Revision ID: 018_snapshot_time_brin
+Revises: 017_payshack_raw_gin
+Create Date: 2026-01-28
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '018_snapshot_time_brin'
+down_revision = '017_payshack_raw_gin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the append-only snapshot_at btree for a BRIN summary."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_balance_snapshots_time_brin',
+            'payshack_balance_snapshots',
+            ['snapshot_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32, 'autosummarize': 'on'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_balance_snapshots_time',
+            table_name='payshack_balance_snapshots',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the snapshot_at btree."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_balance_snapshots_time',
+            'payshack_balance_snapshots',
+            ['snapshot_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_balance_snapshots_time_brin',
+            table_name='payshack_balance_snapshots',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
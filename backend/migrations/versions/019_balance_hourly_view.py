@@ -0,0 +1,45 @@
+"""Hourly balance materialized view over payshack_balance_snapshots.
+
+Revision ID: 019_balance_hourly_view
+Revises: 018_snapshot_time_brin
+Create Date: 2026-01-28
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '019_balance_hourly_view'
+down_revision = '018_snapshot_time_brin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create payshack_balance_hourly (last balance per entity per hour)."""
+    # WITH DATA: REFRESH ... CONCURRENTLY rejects an unpopulated view
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW payshack_balance_hourly AS
+        SELECT entity_type,
+               entity_id,
+               date_trunc('hour', snapshot_at) AS bucket,
+               (array_agg(balance ORDER BY snapshot_at DESC))[1] AS balance,
+               (array_agg(currency ORDER BY snapshot_at DESC))[1] AS currency
+        FROM payshack_balance_snapshots
+        GROUP BY entity_type, entity_id, date_trunc('hour', snapshot_at)
+        WITH DATA
+        """
+    )
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_balance_hourly_entity_bucket',
+        'payshack_balance_hourly',
+        ['entity_type', 'entity_id', 'bucket'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop payshack_balance_hourly."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS payshack_balance_hourly")
@@ -0,0 +1,35 @@
+"""Server-side UUID defaults for PayShack metadata ids.
+
+Revision ID: 020_payshack_uuid_defaults
+Revises: 019_balance_hourly_view
+Create Date: 2026-01-28
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020_payshack_uuid_defaults'
+down_revision = '019_balance_hourly_view'
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    'payshack_clients',
+    'payshack_resellers',
+    'payshack_service_providers',
+    'payshack_balance_snapshots',
+)
+
+
+def upgrade() -> None:
+    """Default id to gen_random_uuid() (built in since PostgreSQL 13)."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Drop the id server defaults."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,65 @@
+"""BIGINT fixed-point copies of amount and amount_usd.
+
+Plain nullable columns: adding them is a catalog-only change, with no
+table rewrite. Existing rows are backfilled one day of created_at at a
+time (as in 009); new rows are filled by app.db.staging at ingest.
+
+Revision ID: 021_amount_micros
+Revises: 020_payshack_uuid_defaults
+Create Date: 2026-01-29
+
+"""
+from datetime import timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021_amount_micros'
+down_revision = '020_payshack_uuid_defaults'
+branch_labels = None
+depends_on = None
+
+# Each window is updated and committed on its own
+BACKFILL_WINDOW = timedelta(days=1)
+
+
+def _backfill_micros() -> None:
+    # Numeric(18, 4) * 10_000 is always integral, so the cast is exact
+    fill = sa.text(
+        "UPDATE transactions "
+        "SET amount_micros = (amount * 10000)::bigint, "
+        "    amount_usd_micros = (amount_usd * 10000)::bigint "
+        "WHERE amount_micros IS NULL "
+        "AND created_at >= :start AND created_at < :end"
+    )
+
+    conn = op.get_bind()
+    start, last = conn.execute(
+        sa.text(
+            "SELECT min(created_at), max(created_at) "
+            "FROM transactions WHERE amount_micros IS NULL"
+        )
+    ).one()
+    if start is None:
+        return
+
+    with op.get_context().autocommit_block():
+        while start <= last:
+            window = {"start": start, "end": start + BACKFILL_WINDOW}
+            conn.execute(fill, window)
+            start = window["end"]
+
+
+def upgrade() -> None:
+    """Add amount_micros / amount_usd_micros (units of 1/10_000) and backfill."""
+    op.add_column('transactions', sa.Column('amount_micros', sa.BigInteger(), nullable=True))
+    op.add_column('transactions', sa.Column('amount_usd_micros', sa.BigInteger(), nullable=True))
+    _backfill_micros()
+
+
+def downgrade() -> None:
+    """Drop the fixed-point columns."""
+    op.drop_column('transactions', 'amount_usd_micros')
+    op.drop_column('transactions', 'amount_micros')
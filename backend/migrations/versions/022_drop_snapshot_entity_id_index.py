@@ -0,0 +1,42 @@
+"""Drop the unused single-column entity_id index on balance snapshots.
+
+ix_balance_snapshots_entity leads with entity_type, so it does not serve
+entity_id-only lookups. None exist: the only reader of this table is the
+hourly balance view refresh, which groups by (entity_type, entity_id).
+
+Revision ID: 022_drop_snapshot_entity_id_index
+Revises: 021_amount_micros
+Create Date: 2026-01-29
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '022_drop_snapshot_entity_id_index'
+down_revision = '021_amount_micros'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop ix_payshack_balance_snapshots_entity_id (no entity_id-only queries)."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_payshack_balance_snapshots_entity_id',
+            table_name='payshack_balance_snapshots',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the entity_id index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payshack_balance_snapshots_entity_id',
+            'payshack_balance_snapshots',
+            ['entity_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,61 @@
+"""Partial (is_active) reseller/status indexes on payshack_clients.
+
+Revision ID: 023_payshack_clients_active_indexes
+Revises: 022_drop_snapshot_entity_id_index
+Create Date: 2026-01-29
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '023_payshack_clients_active_indexes'
+down_revision = '022_drop_snapshot_entity_id_index'
+branch_labels = None
+depends_on = None
+
+# (full index, partial replacement, column)
+INDEXES = (
+    ('ix_payshack_clients_reseller', 'ix_payshack_clients_reseller_active', 'reseller_id'),
+    ('ix_payshack_clients_status', 'ix_payshack_clients_status_active', 'status'),
+)
+
+
+def upgrade() -> None:
+    """Replace the full reseller/status indexes with active-only ones."""
+    with op.get_context().autocommit_block():
+        for full, partial, column in INDEXES:
+            op.create_index(
+                partial,
+                'payshack_clients',
+                [column],
+                postgresql_where=sa.text('is_active'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                full,
+                table_name='payshack_clients',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Restore the full reseller/status indexes."""
+    with op.get_context().autocommit_block():
+        for full, partial, column in INDEXES:
+            op.create_index(
+                full,
+                'payshack_clients',
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                partial,
+                table_name='payshack_clients',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,31 @@
+"""Drop the created_at BRIN now covered by the keyset btree.
+
+Revision ID: 024_drop_txn_created_brin
+Revises: 023_payshack_clients_active_indexes
+Create Date: 2026-01-30
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '024_drop_txn_created_brin'
+down_revision = '023_payshack_clients_active_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop idx_txn_created_brin (idx_txn_created_id serves created_at ranges)."""
+    op.drop_index('idx_txn_created_brin', table_name='transactions')
+
+
+def downgrade() -> None:
+    """Restore the created_at BRIN."""
+    op.create_index(
+        'idx_txn_created_brin',
+        'transactions',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32, 'autosummarize': 'on'},
+    )
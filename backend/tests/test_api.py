@@ -1,7 +1,42 @@
 """API endpoint tests."""
 
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.transaction import Transaction
+
+# All tests here share the session-scoped test database
+pytestmark = pytest.mark.xdist_group("db")
+
+
+@pytest_asyncio.fixture
+async def two_transactions(db_session: AsyncSession):
+    """Two Vima transactions a minute apart (rolled back with the session)."""
+    # create_all builds the partitioned parent only
+    await db_session.execute(
+        text("CREATE TABLE IF NOT EXISTS transactions_default PARTITION OF transactions DEFAULT")
+    )
+    now = datetime.now(timezone.utc)
+    for i in range(2):
+        db_session.add(
+            Transaction(
+                source="vima",
+                source_id=f"op-{i}",
+                amount=Decimal("100"),
+                currency="INR",
+                amount_usd=Decimal("1.2"),
+                status="success",
+                created_at=now - timedelta(minutes=i),
+                raw_data={"note": f"a:b :word {i}"},
+            )
+        )
+    await db_session.flush()
 
 
 @pytest.mark.asyncio
@@ -54,6 +89,34 @@ async def test_list_transactions_with_filters(client: AsyncClient):
     assert "total" in data
 
 
+@pytest.mark.asyncio
+async def test_list_transactions_page_offset(client: AsyncClient, two_transactions):
+    """Without a cursor, page selects the offset."""
+    params = {"limit": 1}
+    first = await client.get("/api/v1/transactions", params={**params, "page": 1})
+    second = await client.get("/api/v1/transactions", params={**params, "page": 2})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    first_ids = [item["id"] for item in first.json()["items"]]
+    second_ids = [item["id"] for item in second.json()["items"]]
+    assert len(first_ids) == 1
+    assert len(second_ids) == 1
+    assert first_ids != second_ids
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_colon_filter_value(client: AsyncClient, two_transactions):
+    """Filter values containing ":word" are not parsed as bind parameters."""
+    response = await client.get(
+        "/api/v1/transactions",
+        params={"raw_key": "note", "raw_value": "a:b :word 0", "raw_op": "ne"},
+    )
+
+    assert response.status_code == 200
+    assert [item["source_id"] for item in response.json()["items"]] == ["op-1"]
+
+
 @pytest.mark.asyncio
 async def test_get_metrics_overview(client: AsyncClient):
     """Test metrics overview endpoint."""
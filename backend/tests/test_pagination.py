@@ -0,0 +1,34 @@
+"""Keyset cursor tests."""
+
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.api.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Cursor decodes back to the ISO/str form of its parts."""
+    ts = datetime(2026, 1, 15, 12, 30, tzinfo=timezone.utc)
+    txn_id = uuid4()
+
+    cursor = encode_cursor(ts, txn_id)
+    created_at, id_str = decode_cursor(cursor, 2)
+
+    assert datetime.fromisoformat(created_at) == ts
+    assert id_str == str(txn_id)
+
+
+def test_cursor_with_date_part():
+    """Dates are encoded as ISO strings."""
+    cursor = encode_cursor(date(2026, 1, 15), "x", "y")
+
+    assert decode_cursor(cursor, 3)[0] == "2026-01-15"
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor("only-one")])
+def test_invalid_cursor(cursor):
+    """Malformed cursors or wrong arity raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
@@ -0,0 +1,68 @@
+"""Reconciliation service tests."""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import reconciliation_service
+from app.services.reconciliation_service import ReconciliationService
+
+
+class FailingStreamSession:
+    """Session stand-in whose match stream fails after the first row."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, obj):
+        obj.id = uuid.uuid4()
+
+    async def refresh(self, obj):
+        pass
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    async def execute(self, statement, params=None):
+        self.calls.append("execute")
+        return MagicMock()
+
+    async def stream(self, statement):
+        async def rows():
+            yield SimpleNamespace(
+                match_status="missing_vima",
+                payshack_id=uuid.uuid4(),
+                match_key="order-1",
+                payshack_amount=Decimal("100"),
+                payshack_status="success",
+            )
+            raise RuntimeError("stream lost")
+
+        return rows()
+
+
+@pytest.mark.asyncio
+async def test_failed_run_rolls_back_saved_chunks(monkeypatch):
+    """A stream error discards flushed result chunks before marking the run failed."""
+    session = FailingStreamSession()
+    monkeypatch.setattr(reconciliation_service, "async_session_maker", lambda: session)
+    monkeypatch.setattr(ReconciliationService, "INSERT_CHUNK_SIZE", 1)
+
+    result = await ReconciliationService().run_for_date(date(2026, 1, 15))
+
+    assert result["status"] == "failed"
+    # run insert, one result chunk, rollback, failed-status update
+    assert session.calls == ["commit", "execute", "rollback", "execute", "commit"]
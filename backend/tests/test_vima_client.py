@@ -1,7 +1,7 @@
 """Tests for Vima API client."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from decimal import Decimal
 
 from app.integrations.vima.client import VimaClient, VimaAPIError
@@ -12,17 +12,14 @@ class TestVimaClient:
     """Tests for VimaClient."""
 
     @pytest.mark.asyncio
-    async def test_client_initialization(self):
+    async def test_client_initialization(self, vima_client: VimaClient):
         """Test client initialization."""
-        client = VimaClient(api_key="test-key")
-        assert client.api_key == "test-key"
-        await client.close()
+        assert vima_client.api_key == "test-key"
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient.get")
-    async def test_get_operations_success(self, mock_get):
+    async def test_get_operations_success(self, vima_client: VimaClient, monkeypatch):
         """Test successful API call."""
-        mock_response = AsyncMock()
+        mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = [
             {
@@ -33,31 +30,46 @@ class TestVimaClient:
                 "current_status": "success",
             }
         ]
-        mock_response.raise_for_status = AsyncMock()
-        mock_get.return_value = mock_response
+        # Patch the shared client's instance, not httpx.AsyncClient globally
+        monkeypatch.setattr(
+            vima_client.client, "get", AsyncMock(return_value=mock_response)
+        )
 
-        client = VimaClient(api_key="test-key")
-        result = await client.get_operations(count=10)
+        result = await vima_client.get_operations(count=10)
         
         assert len(result) == 1
         assert result[0]["operation_id"] == "123"
-        await client.close()
+
+
+@pytest.fixture(scope="module")
+def base_raw():
+    """Minimal successful Vima operation."""
+    return {
+        "operation_id": "123",
+        "complete_amount": 100,
+        "complete_currency": "INR",
+        "current_status": "success",
+        "operation_created_at": "2026-01-15T10:00:00Z",
+    }
+
+
+@pytest.fixture
+def stub_hasher(monkeypatch):
+    """Skip hashing in tests that do not check data_hash."""
+    monkeypatch.setattr(VimaNormalizer, "hasher", staticmethod(lambda data: "0" * 64))
 
 
 class TestVimaNormalizer:
     """Tests for VimaNormalizer."""
 
-    def test_normalize_basic(self):
+    def test_normalize_basic(self, base_raw, stub_hasher):
         """Test basic normalization."""
         raw = {
-            "operation_id": "123",
+            **base_raw,
             "reference_id": "ref-123",
             "client_operation_id": "c-123",
             "project": "91game",
             "complete_amount": 100.00,
-            "complete_currency": "INR",
-            "current_status": "success",
-            "operation_created_at": "2026-01-15T10:00:00Z",
         }
 
         result = VimaNormalizer.normalize(raw)
@@ -68,33 +80,28 @@ class TestVimaNormalizer:
         assert result["amount"] == Decimal("100.00")
         assert result["status"] == "success"
 
-    def test_normalize_status_mapping(self):
-        """Test status normalization."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "original,expected",
+        [
             ("success", "success"),
             ("fail", "failed"),
             ("in_process", "pending"),
             ("user_input_required", "pending"),
-        ]
+        ],
+    )
+    def test_normalize_status_mapping(self, base_raw, stub_hasher, original, expected):
+        """Test status normalization."""
+        raw = {**base_raw, "current_status": original}
 
-        for original, expected in test_cases:
-            raw = {
-                "operation_id": "123",
-                "complete_amount": 100,
-                "current_status": original,
-                "operation_created_at": "2026-01-15T10:00:00Z",
-            }
-            result = VimaNormalizer.normalize(raw)
-            assert result["status"] == expected, f"Expected {expected} for {original}"
+        result = VimaNormalizer.normalize(raw)
+
+        assert result["status"] == expected
 
-    def test_normalize_with_nested_data(self):
+    def test_normalize_with_nested_data(self, base_raw, stub_hasher):
         """Test normalization with nested payer data."""
         raw = {
-            "operation_id": "123",
+            **base_raw,
             "complete_amount": 100.00,
-            "complete_currency": "INR",
-            "current_status": "success",
-            "operation_created_at": "2026-01-15T10:00:00Z",
             "create_params": {
                 "params": {
                     "payment": {
@@ -121,32 +128,16 @@ class TestVimaNormalizer:
         assert result["user_name"] == "Test User"
         assert result["country"] == "IN"
 
-    def test_data_hash_generation(self):
+    def test_data_hash_generation(self, base_raw):
         """Test that data hash is generated."""
-        raw = {
-            "operation_id": "123",
-            "complete_amount": 100,
-            "complete_currency": "INR",
-            "current_status": "success",
-            "operation_created_at": "2026-01-15T10:00:00Z",
-        }
-
-        result = VimaNormalizer.normalize(raw)
+        result = VimaNormalizer.normalize(base_raw)
 
         assert "data_hash" in result
         assert len(result["data_hash"]) == 64
 
-    def test_data_hash_consistency(self):
+    def test_data_hash_consistency(self, base_raw):
         """Test that same data produces same hash."""
-        raw = {
-            "operation_id": "123",
-            "complete_amount": 100,
-            "complete_currency": "INR",
-            "current_status": "success",
-            "operation_created_at": "2026-01-15T10:00:00Z",
-        }
-
-        result1 = VimaNormalizer.normalize(raw)
-        result2 = VimaNormalizer.normalize(raw)
+        result1 = VimaNormalizer.normalize(base_raw)
+        result2 = VimaNormalizer.normalize(dict(base_raw))
 
         assert result1["data_hash"] == result2["data_hash"]
@@ -274,6 +274,8 @@ export interface TransactionsResponse {
   page: number;
   page_size: number;
   pages: number;
+  is_approx?: boolean;
+  next_cursor?: string | null;
 }
 
 export interface ApiError {